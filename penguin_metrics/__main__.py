@@ -7,51 +7,84 @@ Usage:
 """
 
 import argparse
-import asyncio
+import functools
+import os
 import sys
-from pathlib import Path
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
 
 from . import __version__
-from .app import run_app
-from .config.loader import ConfigError, ConfigLoader
 from .logging import LogConfig, get_logger, setup_logging
 
 logger = get_logger("main")
 
+# CLI flag -> console log level, in order of precedence
+_LEVEL_FLAGS = (("debug", "debug"), ("verbose", "info"), ("quiet", "error"))
+
+# --validate summary, rendered once with str.format_map()
+_SUMMARY_TMPL = (
+    "\nConfiguration summary:\n"
+    "  MQTT: {mqtt_host}:{mqtt_port}\n"
+    "  Home Assistant Discovery: {discovery}\n"
+    "  Logging level: {log_level}\n"
+    "{log_file_line}"
+    "  System collectors: {n_system}\n"
+    "  Process monitors: {n_processes}\n"
+    "  Service monitors: {n_services}\n"
+    "  Container monitors: {n_containers}\n"
+    "  Battery monitors: {n_batteries}\n"
+    "  AC power monitors: {n_ac_power}\n"
+    "  Disk monitors: {n_disks}\n"
+    "  Network interfaces: {n_networks}\n"
+    "  Custom sensors: {n_custom}\n"
+    "\nConfiguration is valid!\n"
+)
+
 
 def validate_config(config_path: str) -> int:
     """Validate configuration file and print warnings."""
+    # Deferred so --help/--version don't pay for the config package import
+    from .config.loader import ConfigError, ConfigLoader
+
     try:
         loader = ConfigLoader()
         config = loader.load_file(config_path)
 
         warnings = loader.validate(config)
 
+        # Collect all output and write it in one go
+        lines: list[str] = []
         if warnings:
-            print(f"Configuration warnings ({len(warnings)}):")
-            for warning in warnings:
-                print(f"  - {warning}")
-
-        # Print summary
-        print("\nConfiguration summary:")
-        print(f"  MQTT: {config.mqtt.host}:{config.mqtt.port}")
-        print(
-            f"  Home Assistant Discovery: {'enabled' if config.homeassistant.discovery else 'disabled'}"
+            lines.append(f"Configuration warnings ({len(warnings)}):\n")
+            lines.extend(f"  - {warning}\n" for warning in warnings)
+
+        log_file = config.logging.file
+        lines.append(
+            _SUMMARY_TMPL.format_map(
+                {
+                    "mqtt_host": config.mqtt.host,
+                    "mqtt_port": config.mqtt.port,
+                    "discovery": "enabled" if config.homeassistant.discovery else "disabled",
+                    "log_level": config.logging.level,
+                    "log_file_line": f"  Log file: {log_file}\n" if log_file else "",
+                    "n_system": len(config.system),
+                    "n_processes": len(config.processes),
+                    "n_services": len(config.services),
+                    "n_containers": len(config.containers),
+                    "n_batteries": len(config.batteries),
+                    "n_ac_power": len(config.ac_power),
+                    "n_disks": len(config.disks),
+                    "n_networks": len(config.networks),
+                    "n_custom": len(config.custom),
+                }
+            )
         )
-        print(f"  Logging level: {config.logging.level}")
-        if config.logging.file:
-            print(f"  Log file: {config.logging.file}")
-        print(f"  System collectors: {len(config.system)}")
-        print(f"  Process monitors: {len(config.processes)}")
-        print(f"  Service monitors: {len(config.services)}")
-        print(f"  Container monitors: {len(config.containers)}")
-        print(f"  Battery monitors: {len(config.batteries)}")
-        print(f"  AC power monitors: {len(config.ac_power)}")
-        print(f"  Disk monitors: {len(config.disks)}")
-        print(f"  Network interfaces: {len(config.networks)}")
-        print(f"  Custom sensors: {len(config.custom)}")
-
-        print("\nConfiguration is valid!")
+
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
         return 0
 
     except ConfigError as e:
@@ -62,8 +95,9 @@ def validate_config(config_path: str) -> int:
         return 1
 
 
-def main() -> int:
-    """Main entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (cached; use cache_clear() for a fresh one)."""
     parser = argparse.ArgumentParser(
         prog="penguin-metrics",
         description="Linux system telemetry service for Home Assistant via MQTT",
@@ -121,70 +155,98 @@ def main() -> int:
         version=f"%(prog)s {__version__}",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _loop_factory(choice: str) -> "Callable[[], asyncio.AbstractEventLoop] | None":
+    """Return the event loop factory selected by `event_loop` (None = stock asyncio)."""
+    if choice == "asyncio":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        if choice == "uvloop":
+            logger.warning("event_loop uvloop requested but uvloop is not installed")
+        return None
+
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def main() -> int:
+    """Main entry point."""
+    # Fast path: answer a bare --version without building the parser
+    if sys.argv[1:] == ["--version"]:
+        print(f"penguin-metrics {__version__}")
+        return 0
+
+    args = _build_parser().parse_args()
 
     # Check config file exists
-    config_path = Path(args.config)
-    if not config_path.exists():
+    config_path = os.fspath(args.config)
+    if not os.path.isfile(config_path):
         print(f"Configuration file not found: {config_path}", file=sys.stderr)
         return 1
 
-    # Check if user explicitly specified log level via CLI
-    cli_log_override = args.debug or args.verbose or args.quiet or args.no_color or args.log_file
+    # Console level requested on the command line (None if no level flag given)
+    cli_level = next((level for flag, level in _LEVEL_FLAGS if getattr(args, flag)), None)
 
     # Setup initial logging (before config is loaded)
     # Use minimal logging until config is loaded, unless CLI overrides
-    initial_config = LogConfig()
-    if args.debug:
-        initial_config.console_level = "debug"
-    elif args.verbose:
-        initial_config.console_level = "info"
-    elif args.quiet:
-        initial_config.console_level = "error"
-    else:
-        initial_config.console_level = "warning"  # Minimal during startup
-
-    if args.no_color:
-        initial_config.console_colors = False
-
-    setup_logging(initial_config)
+    setup_logging(
+        LogConfig(
+            console_level=cli_level or "warning",  # Minimal during startup
+            console_colors=not args.no_color,
+        )
+    )
 
     # Validate only
     if args.validate:
-        return validate_config(str(config_path))
+        return validate_config(config_path)
 
     # Build CLI override config only if user explicitly requested it
     cli_log_config = None
-    if cli_log_override:
-        cli_log_config = LogConfig()
-        if args.debug:
-            cli_log_config.console_level = "debug"
-        elif args.verbose:
-            cli_log_config.console_level = "info"
-        elif args.quiet:
-            cli_log_config.console_level = "error"
-        else:
-            cli_log_config.console_level = "info"  # Default if only --no-color or --log-file
-
-        if args.no_color:
-            cli_log_config.console_colors = False
-
+    if cli_level or args.no_color or args.log_file:
+        cli_log_config = LogConfig(
+            console_level=cli_level or "info",  # Default if only --no-color or --log-file
+            console_colors=not args.no_color,
+        )
         if args.log_file:
             cli_log_config.file_enabled = True
             cli_log_config.file_path = args.log_file
 
-    # Run application
+    # Run application (heavy imports deferred until we know we need them)
+    import asyncio
+
+    from .app import run_app
+    from .config.loader import ConfigError, ConfigLoader
+
     try:
-        asyncio.run(run_app(str(config_path), cli_log_config=cli_log_config))
+        # Parsed once here: the event loop choice is needed before run_app() starts
+        loader = ConfigLoader()
+        config = loader.load_file(config_path)
+
+        # Runner cancels the main task on Ctrl+C before startup signal handlers exist;
+        # afterwards Application's own SIGINT/SIGTERM handlers drive a graceful stop
+        with asyncio.Runner(loop_factory=_loop_factory(config.event_loop)) as runner:
+            runner.run(
+                run_app(config_path, cli_log_config=cli_log_config, config=config, loader=loader)
+            )
         return 0
     except ConfigError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         return 1
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
         return 0
+    except (OSError, RuntimeError) as e:
+        # Environmental failures (sockets, files, event loop) recur under systemd
+        # restarts; only format the traceback when debugging
+        logger.error("Fatal error: %s", e, exc_info=args.debug)
+        return 1
     except Exception as e:
-        logger.exception(f"Fatal error: {e}")
+        logger.exception("Fatal error: %s", e)
         return 1
 
 
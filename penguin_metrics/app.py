@@ -9,32 +9,148 @@ Handles:
 """
 
 import asyncio
+import dataclasses
+import functools
+import heapq
+import itertools
+import logging
+import os
 import signal
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Protocol, TypedDict
 
-from .collectors.ac_power import ACPowerCollector
+import psutil
+
+from .collectors.ac_power import ACPowerCollector, discover_ac_power
 from .collectors.base import Collector
-from .collectors.battery import BatteryCollector
+from .collectors.battery import BatteryCollector, discover_batteries
 from .collectors.container import ContainerCollector
 from .collectors.custom import CustomCollector
 from .collectors.custom_binary import CustomBinarySensorCollector
-from .collectors.disk import DiskCollector
-from .collectors.fan import FanCollector
+from .collectors.disk import DiskCollector, discover_disks
+from .collectors.fan import FanCollector, discover_fan_hwmons
 from .collectors.gpu import GPUCollector
-from .collectors.network import NetworkCollector
+from .collectors.network import NetworkCollector, discover_network_interfaces
 from .collectors.process import ProcessCollector
 from .collectors.service import ServiceCollector
 from .collectors.system import SystemCollector
-from .collectors.temperature import TemperatureCollector
+from .collectors.temperature import (
+    TemperatureCollector,
+    discover_hwmon_sensors,
+    discover_thermal_zones,
+)
 from .config.loader import ConfigLoader
-from .config.schema import Config
+from .config.schema import (
+    ACPowerConfig,
+    ACPowerMatchConfig,
+    ACPowerMatchType,
+    BatteryConfig,
+    BatteryMatchConfig,
+    BatteryMatchType,
+    Config,
+    ContainerConfig,
+    ContainerMatchConfig,
+    ContainerMatchType,
+    DefaultsConfig,
+    DeviceConfig,
+    DiskConfig,
+    DiskMatchConfig,
+    DiskMatchType,
+    FanConfig,
+    FanMatchConfig,
+    FanMatchType,
+    NetworkConfig,
+    NetworkMatchConfig,
+    NetworkMatchType,
+    ProcessConfig,
+    ProcessMatchConfig,
+    ProcessMatchType,
+    ServiceConfig,
+    ServiceMatchConfig,
+    ServiceMatchType,
+    TemperatureConfig,
+    TemperatureMatchConfig,
+    TemperatureMatchType,
+)
 from .logging import LogConfig, get_logger, setup_logging
 from .models.device import Device
 from .mqtt.client import MQTTClient
 from .mqtt.homeassistant import HomeAssistantDiscovery
+from .utils.docker_api import DockerClient
+from .utils.systemd import SystemdUnits
 
 logger = get_logger("app")
 
+# Upper bound on collectors collecting at the same time
+MAX_CONCURRENT_COLLECTS = 32
+
+# Auto-discovery of one source type: (names to skip, topic prefix, parent device) -> collectors
+_Discover = Callable[[frozenset[str], str, Device | None], Awaitable[list[Collector]]]
+
+
+class _CollectorFactory(Protocol):
+    """Collector class built from a config block (every source except system and GPU)."""
+
+    SOURCE_TYPE: str
+
+    def __call__(
+        self,
+        *,
+        config: Any,
+        defaults: DefaultsConfig,
+        topic_prefix: str,
+        parent_device: Device | None,
+        device_templates: dict[str, DeviceConfig],
+    ) -> Collector: ...
+
+
+class _LogFileSettings(TypedDict):
+    """LogConfig file fields taken from the config file's logging block."""
+
+    file_enabled: bool
+    file_path: str
+    file_level: str
+    file_max_bytes: int
+    file_backup_count: int
+
+
+def _in_thread(
+    discover: Callable[[frozenset[str], str, Device | None], list[Collector]],
+) -> _Discover:
+    """Wrap a blocking (sysfs/procfs) discovery so it runs in a worker thread."""
+
+    async def run(
+        exclude: frozenset[str], topic_prefix: str, parent: Device | None
+    ) -> list[Collector]:
+        return await asyncio.to_thread(discover, exclude, topic_prefix, parent)
+
+    return run
+
+
+def _path_fingerprint(path: str) -> tuple[str, ...] | bytes:
+    """Cheap change marker for a discovery source: a directory listing or file contents."""
+    try:
+        return tuple(sorted(os.listdir(path)))
+    except NotADirectoryError:
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def _next_slot(now: float, interval: float) -> float:
+    """
+    Next deadline on an interval's grid of loop times.
+
+    Collectors sharing an interval come due together and run from one wakeup.
+    A slot less than half an interval away is skipped, so a collector started
+    just before a slot does not run two cycles milliseconds apart.
+    """
+    if interval <= 0:
+        return now
+    slot = (now // interval + 1) * interval
+    if slot - now < interval / 2:
+        slot += interval
+    return slot
+
 
 class Application:
     """
@@ -43,6 +159,34 @@ class Application:
     Orchestrates collectors, MQTT client, and Home Assistant integration.
     """
 
+    __slots__ = (
+        "config",
+        "mqtt",
+        "ha",
+        "collectors",
+        "_manual_names",
+        "_auto_keys",
+        "_running",
+        "_shutdown_event",
+        "_refresh_task",
+        "_state_dirty",
+        "_scheduler_task",
+        "_schedule",
+        "_scheduled",
+        "_schedule_seq",
+        "_schedule_changed",
+        "_collector_tasks",
+        "_source_topics",
+        "_last_published",
+        "_published_connection",
+        "_collect_limit",
+        "_docker",
+        "_systemd_units",
+        "_disc_fingerprints",
+        "_disc_listings",
+        "_system_device",
+    )
+
     def __init__(self, config: Config):
         """
         Initialize application.
@@ -66,26 +210,62 @@ class Application:
         )
 
         # Collectors
-        self.collectors: list[Collector] = []
+        self.collectors: dict[str, Collector] = {}  # collector_key -> collector
+
+        # source_type -> names of manually configured sources (never auto-added/removed)
+        self._manual_names: dict[str, frozenset[str]] = {
+            source_type: frozenset(cfg.name for cfg in configs)
+            for source_type, configs in (
+                ("service", config.services),
+                ("docker", config.containers),
+                ("process", config.processes),
+                ("temperature", config.temperatures),
+                ("battery", config.batteries),
+                ("ac_power", config.ac_power),
+                ("disk", config.disks),
+                ("network", config.networks),
+                ("fan", config.fans),
+            )
+        }
+        # source_type -> keys of auto-discovered collectors, kept up to date on add/remove
+        self._auto_keys: dict[str, set[str]] = {
+            source_type: set() for source_type in self._manual_names
+        }
 
         # State
         self._running = False
-        self._tasks: list[asyncio.Task] = []
-        self._collector_tasks: dict[str, asyncio.Task] = {}  # collector_id -> task
         self._shutdown_event = asyncio.Event()
         self._refresh_task: asyncio.Task | None = None
+        self._state_dirty = False  # HA state file needs saving after collector churn
+
+        # Scheduler: min-heap of (deadline, seq, collector) driven by a single task.
+        # Entries whose seq no longer matches _scheduled[collector_key] are stale.
+        self._scheduler_task: asyncio.Task | None = None
+        self._schedule: list[tuple[float, int, Collector]] = []
+        self._scheduled: dict[str, int] = {}  # collector_key -> seq of live heap entry
+        self._schedule_seq = itertools.count()
+        self._schedule_changed = asyncio.Event()
+        self._collector_tasks: dict[str, asyncio.Task] = {}  # collector_key -> in-flight cycle
+        self._source_topics: dict[str, str] = {}  # collector_key -> JSON state topic
+        # collector_key -> (data, loop time) of its last publish (with republish_unchanged)
+        self._last_published: dict[str, tuple[dict[str, Any], float]] = {}
+        self._published_connection = 0  # MQTT connection the _last_published entries went to
+        self._collect_limit = asyncio.Semaphore(MAX_CONCURRENT_COLLECTS)
+        self._docker: DockerClient | None = None  # Reused across container discoveries
+        self._systemd_units = SystemdUnits()  # Cached service unit list
+        # source_type -> fingerprint of a sysfs/procfs listing whose sources are all running;
+        # refreshes skip the rescan while the listing still matches it
+        self._disc_fingerprints: dict[str, object] = {}
+        # source_type -> fingerprint seen at its last rescan (settling, not yet trusted)
+        self._disc_listings: dict[str, object] = {}
+        # Device of the first system collector, parent of auto-discovered sources
+        self._system_device: Device | None = None
 
     async def _create_collectors(self) -> list[Collector]:
         """Create all configured collectors."""
         collectors: list[Collector] = []
         topic_prefix = self.config.mqtt.topic_prefix
 
-        # Track manually configured names to avoid duplicates with auto-discovery
-        manual_temps: set[str] = set()
-        manual_batteries: set[str] = set()
-        manual_containers: set[str] = set()
-        manual_services: set[str] = set()
-
         # Get device templates from config
         device_templates = self.config.device_templates
 
@@ -103,6 +283,7 @@ class Application:
             # Get system device for temperature/GPU sensors (use first system)
             if system_device is None:
                 system_device = system_collector.create_device()
+                self._system_device = system_device
 
             # Add GPU collector if enabled - uses system device
             if sys_config.gpu:
@@ -116,220 +297,110 @@ class Application:
                     )
                 )
 
-        # Standalone temperature collectors (manual) - part of system device by default
-        for temp_config in self.config.temperatures:
-            manual_temps.add(temp_config.name)
-            collectors.append(
-                TemperatureCollector(
-                    config=temp_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    parent_device=system_device,
-                    device_templates=device_templates,
-                )
-            )
-
-        # Auto-discover temperatures - always use system device
-        auto_temps = self._auto_discover_temperatures(manual_temps, topic_prefix, system_device)
-        if auto_temps:
-            logger.info(f"Auto-discovered {len(auto_temps)} temperature sensors")
-        collectors.extend(auto_temps)
-
-        # Process collectors (manual)
-        manual_processes: set[str] = set()
-        for proc_config in self.config.processes:
-            manual_processes.add(proc_config.name)
-            collectors.append(
-                ProcessCollector(
-                    config=proc_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    device_templates=device_templates,
-                    parent_device=system_device,
-                )
-            )
-
-        # Auto-discover processes
-        auto_processes = self._auto_discover_processes(
-            manual_processes, topic_prefix, system_device
-        )
-        if auto_processes:
-            logger.info(f"Auto-discovered {len(auto_processes)} processes")
-        collectors.extend(auto_processes)
-
-        # Service collectors (manual)
-        for svc_config in self.config.services:
-            manual_services.add(svc_config.name)
-            collectors.append(
-                ServiceCollector(
-                    config=svc_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    device_templates=device_templates,
-                    parent_device=system_device,
-                )
-            )
-
-        # Auto-discover services
-        auto_services = self._auto_discover_services(manual_services, topic_prefix, system_device)
-        if auto_services:
-            logger.info(f"Auto-discovered {len(auto_services)} services")
-        collectors.extend(auto_services)
-
-        # Container collectors (manual)
-        for cont_config in self.config.containers:
-            manual_containers.add(cont_config.name)
-            collectors.append(
-                ContainerCollector(
-                    config=cont_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    device_templates=device_templates,
-                    parent_device=system_device,
-                )
-            )
-
-        # Auto-discover containers
-        auto_containers = await self._auto_discover_containers(
-            manual_containers, topic_prefix, system_device
+        # Remaining sources, in registration order: (manual configs, collector class,
+        # auto-discovery or None, log label)
+        sources: tuple[tuple[list[Any], _CollectorFactory, _Discover | None, str], ...] = (
+            (
+                self.config.temperatures,
+                TemperatureCollector,
+                # sysfs scans run off the event loop
+                _in_thread(self._auto_discover_temperatures),
+                "temperature sensors",
+            ),
+            (
+                self.config.processes,
+                ProcessCollector,
+                # Walks /proc, keep it off the event loop
+                _in_thread(self._auto_discover_processes),
+                "processes",
+            ),
+            (self.config.services, ServiceCollector, self._auto_discover_services, "services"),
+            (
+                self.config.containers,
+                ContainerCollector,
+                self._auto_discover_containers,
+                "containers",
+            ),
+            (
+                self.config.batteries,
+                BatteryCollector,
+                _in_thread(self._auto_discover_batteries),
+                "batteries",
+            ),
+            (
+                self.config.ac_power,
+                ACPowerCollector,
+                _in_thread(self._auto_discover_ac_power),
+                "AC power supplies",
+            ),
+            (
+                self.config.disks,
+                DiskCollector,
+                _in_thread(self._auto_discover_disks),
+                "disks",
+            ),
+            (
+                self.config.networks,
+                NetworkCollector,
+                # psutil reads /proc/net/dev
+                _in_thread(self._auto_discover_networks),
+                "network interfaces",
+            ),
+            (
+                self.config.fans,
+                FanCollector,
+                _in_thread(self._auto_discover_fans),
+                "fan collectors",
+            ),
+            (self.config.custom, CustomCollector, None, "custom sensors"),
+            (self.config.binary_sensors, CustomBinarySensorCollector, None, "binary sensors"),
         )
-        if auto_containers:
-            logger.info(f"Auto-discovered {len(auto_containers)} containers")
-        collectors.extend(auto_containers)
-
-        # Battery collectors (manual) - part of system device by default
-        for bat_config in self.config.batteries:
-            manual_batteries.add(bat_config.name)
-            collectors.append(
-                BatteryCollector(
-                    config=bat_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    parent_device=system_device,
-                    device_templates=device_templates,
-                )
-            )
 
-        # Auto-discover batteries - always use system device
-        auto_batteries = self._auto_discover_batteries(
-            manual_batteries, topic_prefix, system_device
-        )
-        if auto_batteries:
-            logger.info(f"Auto-discovered {len(auto_batteries)} batteries")
-        collectors.extend(auto_batteries)
-
-        # AC power (external power supply) - part of system device by default
-        manual_ac_power: set[str] = set()
-        for ac_config in self.config.ac_power:
-            manual_ac_power.add(ac_config.name)
-            collectors.append(
-                ACPowerCollector(
-                    config=ac_config,
+        async def discover_one(discover: _Discover, source_type: str) -> list[Collector]:
+            # Skip names that are configured manually
+            return await discover(self._manual_names[source_type], topic_prefix, system_device)
+
+        # Run all auto-discoveries at once so sysfs/procfs scans, D-Bus and Docker overlap
+        async with asyncio.TaskGroup() as tg:
+            discovered = [
+                tg.create_task(discover_one(discover, collector_cls.SOURCE_TYPE))
+                if discover is not None
+                else None
+                for _, collector_cls, discover, _ in sources
+            ]
+
+        for (configs, collector_cls, _, label), task in zip(sources, discovered, strict=True):
+            # Manual collectors - part of system device by default
+            collectors.extend(
+                collector_cls(
+                    config=cfg,
                     defaults=self.config.defaults,
                     topic_prefix=topic_prefix,
                     parent_device=system_device,
                     device_templates=device_templates,
                 )
+                for cfg in configs
             )
 
-        # Auto-discover AC power supplies - always use system device
-        auto_ac_power = self._auto_discover_ac_power(manual_ac_power, topic_prefix, system_device)
-        if auto_ac_power:
-            logger.info(f"Auto-discovered {len(auto_ac_power)} AC power supplies")
-        collectors.extend(auto_ac_power)
-
-        # Disk collectors (manual) - part of system device by default
-        manual_disks: set[str] = set()
-        for disk_config in self.config.disks:
-            manual_disks.add(disk_config.name)
-            collectors.append(
-                DiskCollector(
-                    config=disk_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    parent_device=system_device,
-                    device_templates=device_templates,
-                )
-            )
-
-        # Auto-discover disks - always use system device
-        auto_disks = self._auto_discover_disks(manual_disks, topic_prefix, system_device)
-        if auto_disks:
-            logger.info(f"Auto-discovered {len(auto_disks)} disks")
-        collectors.extend(auto_disks)
-
-        # Network interface collectors (manual) - part of system device by default
-        manual_networks: set[str] = set()
-        for net_config in self.config.networks:
-            manual_networks.add(net_config.name)
-            collectors.append(
-                NetworkCollector(
-                    config=net_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    parent_device=system_device,
-                    device_templates=device_templates,
-                )
-            )
-
-        # Auto-discover network interfaces - always use system device
-        auto_networks = self._auto_discover_networks(manual_networks, topic_prefix, system_device)
-        if auto_networks:
-            logger.info(f"Auto-discovered {len(auto_networks)} network interfaces")
-        collectors.extend(auto_networks)
-
-        # Fan collectors (manual) - part of system device by default
-        manual_fans: set[str] = set()
-        for fan_config in self.config.fans:
-            manual_fans.add(fan_config.name)
-            collectors.append(
-                FanCollector(
-                    config=fan_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    parent_device=system_device,
-                    device_templates=device_templates,
-                )
-            )
-
-        # Auto-discover fans (hwmon with fan*_input)
-        auto_fans = self._auto_discover_fans(manual_fans, topic_prefix, system_device)
-        if auto_fans:
-            logger.info(f"Auto-discovered {len(auto_fans)} fan collectors")
-        collectors.extend(auto_fans)
-
-        # Custom collectors
-        for custom_config in self.config.custom:
-            collectors.append(
-                CustomCollector(
-                    config=custom_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    device_templates=device_templates,
-                    parent_device=system_device,
-                )
-            )
+            if task is None:
+                continue
 
-        # Custom binary sensor collectors
-        for binary_config in self.config.binary_sensors:
-            collectors.append(
-                CustomBinarySensorCollector(
-                    config=binary_config,
-                    defaults=self.config.defaults,
-                    topic_prefix=topic_prefix,
-                    device_templates=device_templates,
-                    parent_device=system_device,
-                )
-            )
+            auto = task.result()
+            if auto:
+                logger.info("Auto-discovered %s %s", len(auto), label)
+            collectors.extend(auto)
 
         return collectors
 
+    def _auto_collector(self, source_type: str, name: str) -> Collector | None:
+        """Return the running auto-discovered collector for a source, if there is one."""
+        key = f"{source_type}:{name}"
+        return self.collectors.get(key) if key in self._auto_keys[source_type] else None
+
     def _auto_discover_temperatures(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover temperature sensors."""
-        from .collectors.temperature import discover_hwmon_sensors, discover_thermal_zones
-
         auto_cfg = self.config.auto_temperatures
         if not auto_cfg.enabled:
             return []
@@ -337,14 +408,6 @@ class Application:
         collectors: list[Collector] = []
         device_templates = self.config.device_templates
 
-        def apply_overrides(config_obj: Any) -> None:
-            """Apply bool and interval overrides from auto-discovery block."""
-            for key, val in auto_cfg.options.items():
-                if hasattr(config_obj, key):
-                    setattr(config_obj, key, val)
-            if auto_cfg.update_interval is not None and hasattr(config_obj, "update_interval"):
-                config_obj.update_interval = auto_cfg.update_interval
-
         if auto_cfg.source == "thermal":
             # Discover thermal zones from /sys/class/thermal
             for zone in discover_thermal_zones():
@@ -354,11 +417,10 @@ class Application:
                 if not auto_cfg.matches(name):
                     continue
 
-                from .config.schema import (
-                    TemperatureConfig,
-                    TemperatureMatchConfig,
-                    TemperatureMatchType,
-                )
+                # Already collecting this source: keep its collector
+                if running := self._auto_collector("temperature", name):
+                    collectors.append(running)
+                    continue
 
                 config = TemperatureConfig.from_defaults(
                     name=name,
@@ -366,7 +428,7 @@ class Application:
                     defaults=self.config.defaults,
                 )
                 config.device_ref = auto_cfg.device_ref  # Use auto-discovery device_ref
-                apply_overrides(config)
+                auto_cfg.apply_overrides(config)
                 collectors.append(
                     TemperatureCollector(
                         config=config,
@@ -376,7 +438,7 @@ class Application:
                         device_templates=device_templates,
                     )
                 )
-                logger.debug(f"Auto-discovered thermal zone: {name}")
+                logger.debug("Auto-discovered thermal zone: %s", name)
 
         elif auto_cfg.source == "hwmon":
             # Discover hwmon sensors via psutil
@@ -387,11 +449,10 @@ class Application:
                 if not auto_cfg.matches(name):
                     continue
 
-                from .config.schema import (
-                    TemperatureConfig,
-                    TemperatureMatchConfig,
-                    TemperatureMatchType,
-                )
+                # Already collecting this source: keep its collector
+                if running := self._auto_collector("temperature", name):
+                    collectors.append(running)
+                    continue
 
                 config = TemperatureConfig.from_defaults(
                     name=name,
@@ -399,7 +460,7 @@ class Application:
                     defaults=self.config.defaults,
                 )
                 config.device_ref = auto_cfg.device_ref  # Use auto-discovery device_ref
-                apply_overrides(config)
+                auto_cfg.apply_overrides(config)
                 collectors.append(
                     TemperatureCollector(
                         config=config,
@@ -409,19 +470,17 @@ class Application:
                         device_templates=device_templates,
                     )
                 )
-                logger.debug(f"Auto-discovered hwmon sensor: {name}")
+                logger.debug("Auto-discovered hwmon sensor: %s", name)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} temperature sensors")
+            logger.debug("Found %s temperature sensors", len(collectors))
 
         return collectors
 
     def _auto_discover_batteries(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover battery devices."""
-        from .collectors.battery import discover_batteries
-
         auto_cfg = self.config.auto_batteries
         if not auto_cfg.enabled:
             return []
@@ -436,7 +495,10 @@ class Application:
             if not auto_cfg.matches(name):
                 continue
 
-            from .config.schema import BatteryConfig, BatteryMatchConfig, BatteryMatchType
+            # Already collecting this source: keep its collector
+            if running := self._auto_collector("battery", name):
+                collectors.append(running)
+                continue
 
             config = BatteryConfig.from_defaults(
                 name=name,
@@ -445,11 +507,7 @@ class Application:
             )
             config.device_ref = auto_cfg.device_ref  # Use auto-discovery device_ref
             # Apply per-metric overrides from auto-discovery block
-            for key, val in auto_cfg.options.items():
-                if hasattr(config, key):
-                    setattr(config, key, val)
-            if auto_cfg.update_interval is not None:
-                config.update_interval = auto_cfg.update_interval
+            auto_cfg.apply_overrides(config)
             collectors.append(
                 BatteryCollector(
                     config=config,
@@ -459,19 +517,17 @@ class Application:
                     device_templates=device_templates,
                 )
             )
-            logger.debug(f"Auto-discovered battery: {name}")
+            logger.debug("Auto-discovered battery: %s", name)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} batteries")
+            logger.debug("Found %s batteries", len(collectors))
 
         return collectors
 
     def _auto_discover_ac_power(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover external power supplies (non-battery)."""
-        from .collectors.ac_power import discover_ac_power
-
         auto_cfg = self.config.auto_ac_powers
         if not auto_cfg.enabled:
             return []
@@ -486,7 +542,10 @@ class Application:
             if not auto_cfg.matches(name) and not auto_cfg.matches(ps.type):
                 continue
 
-            from .config.schema import ACPowerConfig, ACPowerMatchConfig, ACPowerMatchType
+            # Already collecting this source: keep its collector
+            if running := self._auto_collector("ac_power", name):
+                collectors.append(running)
+                continue
 
             config = ACPowerConfig.from_defaults(
                 name=name,
@@ -507,19 +566,17 @@ class Application:
                     device_templates=device_templates,
                 )
             )
-            logger.debug(f"Auto-discovered AC power supply: {name} (type={ps.type})")
+            logger.debug("Auto-discovered AC power supply: %s (type=%s)", name, ps.type)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} AC power supplies")
+            logger.debug("Found %s AC power supplies", len(collectors))
 
         return collectors
 
     def _auto_discover_disks(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover disk partitions."""
-        from .collectors.disk import discover_disks
-
         auto_cfg = self.config.auto_disks
         if not auto_cfg.enabled:
             return []
@@ -534,7 +591,10 @@ class Application:
             if not auto_cfg.matches(name):
                 continue
 
-            from .config.schema import DiskConfig, DiskMatchConfig, DiskMatchType
+            # Already collecting this source: keep its collector
+            if running := self._auto_collector("disk", name):
+                collectors.append(running)
+                continue
 
             config = DiskConfig.from_defaults(
                 name=name,
@@ -544,11 +604,7 @@ class Application:
             # Apply auto-discovery device_ref
             config.device_ref = auto_cfg.device_ref
             # Apply overrides from auto-discovery block
-            for key, val in auto_cfg.options.items():
-                if hasattr(config, key):
-                    setattr(config, key, val)
-            if auto_cfg.update_interval is not None:
-                config.update_interval = auto_cfg.update_interval
+            auto_cfg.apply_overrides(config)
             collectors.append(
                 DiskCollector(
                     config=config,
@@ -558,20 +614,17 @@ class Application:
                     device_templates=device_templates,
                 )
             )
-            logger.debug(f"Auto-discovered disk: {name} ({disk.mountpoint})")
+            logger.debug("Auto-discovered disk: %s (%s)", name, disk.mountpoint)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} disks")
+            logger.debug("Found %s disks", len(collectors))
 
         return collectors
 
     def _auto_discover_networks(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover network interfaces."""
-        from .collectors.network import discover_network_interfaces
-        from .config.schema import NetworkConfig, NetworkMatchConfig, NetworkMatchType
-
         auto_cfg = self.config.auto_networks
         if not auto_cfg.enabled:
             return []
@@ -585,17 +638,18 @@ class Application:
             if not auto_cfg.matches(iface):
                 continue
 
+            # Already collecting this source: keep its collector
+            if running := self._auto_collector("network", iface):
+                collectors.append(running)
+                continue
+
             config = NetworkConfig.from_defaults(
                 name=iface,
                 match=NetworkMatchConfig(type=NetworkMatchType.NAME, value=iface),
                 defaults=self.config.defaults,
             )
             config.device_ref = auto_cfg.device_ref
-            for key, val in auto_cfg.options.items():
-                if hasattr(config, key):
-                    setattr(config, key, val)
-            if auto_cfg.update_interval is not None:
-                config.update_interval = auto_cfg.update_interval
+            auto_cfg.apply_overrides(config)
 
             collectors.append(
                 NetworkCollector(
@@ -606,20 +660,17 @@ class Application:
                     device_templates=device_templates,
                 )
             )
-            logger.debug(f"Auto-discovered network interface: {iface}")
+            logger.debug("Auto-discovered network interface: %s", iface)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} network interfaces")
+            logger.debug("Found %s network interfaces", len(collectors))
 
         return collectors
 
     def _auto_discover_fans(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover fan (hwmon) collectors."""
-        from .collectors.fan import discover_fan_hwmons
-        from .config.schema import FanConfig, FanMatchConfig, FanMatchType
-
         auto_cfg = self.config.auto_fans
         if not auto_cfg.enabled:
             return []
@@ -634,17 +685,18 @@ class Application:
             if not auto_cfg.matches(name):
                 continue
 
+            # Already collecting this source: keep its collector
+            if running := self._auto_collector("fan", name):
+                collectors.append(running)
+                continue
+
             config = FanConfig.from_defaults(
                 name=name,
                 match=FanMatchConfig(type=FanMatchType.HWMON, value=hwmon_basename),
                 defaults=self.config.defaults,
             )
             config.device_ref = auto_cfg.device_ref
-            for key, val in auto_cfg.options.items():
-                if hasattr(config, key):
-                    setattr(config, key, val)
-            if auto_cfg.update_interval is not None:
-                config.update_interval = auto_cfg.update_interval
+            auto_cfg.apply_overrides(config)
 
             collectors.append(
                 FanCollector(
@@ -655,25 +707,25 @@ class Application:
                     device_templates=device_templates,
                 )
             )
-            logger.debug(f"Auto-discovered fan hwmon: {name} ({hwmon_basename})")
+            logger.debug("Auto-discovered fan hwmon: %s (%s)", name, hwmon_basename)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} fan collectors")
+            logger.debug("Found %s fan collectors", len(collectors))
 
         return collectors
 
     async def _auto_discover_containers(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover Docker containers."""
-        from .utils.docker_api import DockerClient
-
         auto_cfg = self.config.auto_containers
         if not auto_cfg.enabled:
             return []
 
         collectors: list[Collector] = []
-        docker = DockerClient()
+        if self._docker is None:
+            self._docker = DockerClient()
+        docker = self._docker
         device_templates = self.config.device_templates
 
         if not docker.available:
@@ -681,19 +733,22 @@ class Application:
             return []
 
         try:
-            containers = await docker.list_containers(all=False)  # Only running containers
+            # Only running containers; names are all discovery needs
+            names = await docker.list_container_names(filters={"status": ["running"]})
         except Exception as e:
-            logger.warning(f"Failed to list containers: {e}")
+            logger.warning("Failed to list containers: %s", e)
             return []
 
-        for container in containers:
-            name = container.name
+        for name in names:
             if name in exclude:
                 continue
             if not auto_cfg.matches(name):
                 continue
 
-            from .config.schema import ContainerConfig, ContainerMatchConfig, ContainerMatchType
+            # Already collecting this source: keep its collector
+            if running := self._auto_collector("docker", name):
+                collectors.append(running)
+                continue
 
             config = ContainerConfig.from_defaults(
                 name=name,
@@ -702,11 +757,7 @@ class Application:
             )
             # Apply auto-discovery device_ref and overrides
             config.device_ref = auto_cfg.device_ref
-            for key, val in auto_cfg.options.items():
-                if hasattr(config, key):
-                    setattr(config, key, val)
-            if auto_cfg.update_interval is not None:
-                config.update_interval = auto_cfg.update_interval
+            auto_cfg.apply_overrides(config)
             collectors.append(
                 ContainerCollector(
                     config=config,
@@ -716,19 +767,17 @@ class Application:
                     parent_device=parent_device,
                 )
             )
-            logger.debug(f"Auto-discovered container: {name}")
+            logger.debug("Auto-discovered container: %s", name)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} containers")
+            logger.debug("Found %s containers", len(collectors))
 
         return collectors
 
-    def _auto_discover_services(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+    async def _auto_discover_services(
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
         """Auto-discover systemd services."""
-        import subprocess
-
         auto_cfg = self.config.auto_services
         if not auto_cfg.enabled:
             return []
@@ -743,40 +792,29 @@ class Application:
 
         collectors: list[Collector] = []
         device_templates = self.config.device_templates
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
-            # Get list of all services
-            result = subprocess.run(
-                ["systemctl", "list-units", "--type=service", "--no-legend", "--all"],
-                capture_output=True,
-                text=True,
-                timeout=10,
+            # Let systemd pre-filter: a filter may name the unit or the bare service name
+            patterns = dict.fromkeys(
+                pattern
+                for f in auto_cfg.filters
+                for pattern in (f, f if f.endswith(".service") else f"{f}.service")
             )
+            units = await self._systemd_units.list_services(list(patterns))
 
-            for line in result.stdout.strip().split("\n"):
-                if not line.strip():
-                    continue
-
-                parts = line.split()
-                if not parts:
-                    continue
-
-                # Skip status symbols (● for failed services)
-                unit_name = parts[0]
-                if unit_name in ("●", "○", "×") or not unit_name.endswith(".service"):
-                    # Try next part if first is a status symbol
-                    if len(parts) > 1 and parts[1].endswith(".service"):
-                        unit_name = parts[1]
-                    else:
-                        continue
-                name = unit_name.replace(".service", "")
+            for unit_name in units:
+                name = unit_name.removesuffix(".service")
 
                 if name in exclude:
                     continue
                 if not auto_cfg.matches(unit_name) and not auto_cfg.matches(name):
                     continue
 
-                from .config.schema import ServiceConfig, ServiceMatchConfig, ServiceMatchType
+                # Already collecting this source: keep its collector
+                if running := self._auto_collector("service", name):
+                    collectors.append(running)
+                    continue
 
                 config = ServiceConfig.from_defaults(
                     name=name,
@@ -785,11 +823,7 @@ class Application:
                 )
                 # Apply auto-discovery device_ref and overrides
                 config.device_ref = auto_cfg.device_ref
-                for key, val in auto_cfg.options.items():
-                    if hasattr(config, key):
-                        setattr(config, key, val)
-                if auto_cfg.update_interval is not None:
-                    config.update_interval = auto_cfg.update_interval
+                auto_cfg.apply_overrides(config)
                 collectors.append(
                     ServiceCollector(
                         config=config,
@@ -799,21 +833,25 @@ class Application:
                         parent_device=parent_device,
                     )
                 )
-                logger.debug(f"Auto-discovered service: {name}")
+                if debug:
+                    logger.debug("Auto-discovered service: %s", name)
 
         except Exception as e:
-            logger.warning(f"Failed to list services: {e}")
+            logger.warning("Failed to list services: %s", e)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} services")
+            logger.debug("Found %s services", len(collectors))
 
         return collectors
 
     def _auto_discover_processes(
-        self, exclude: set[str], topic_prefix: str, parent_device: Device | None = None
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
     ) -> list[Collector]:
-        """Auto-discover running processes."""
-        import psutil
+        """
+        Auto-discover running processes.
+
+        Walks /proc, so callers run it in a worker thread.
+        """
 
         auto_cfg = self.config.auto_processes
         if not auto_cfg.enabled:
@@ -829,9 +867,11 @@ class Application:
 
         collectors: list[Collector] = []
         device_templates = self.config.device_templates
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+            # Only pid and name are needed; process_iter reads them in one oneshot() pass
+            for proc in psutil.process_iter(["pid", "name"]):
                 try:
                     name = proc.info["name"]
                     if not name:
@@ -846,7 +886,10 @@ class Application:
                     # Create unique collector name
                     collector_name = f"{name}_{proc.info['pid']}"
 
-                    from .config.schema import ProcessConfig, ProcessMatchConfig, ProcessMatchType
+                    # Already collecting this process: keep its collector
+                    if running := self._auto_collector("process", collector_name):
+                        collectors.append(running)
+                        continue
 
                     config = ProcessConfig.from_defaults(
                         name=collector_name,
@@ -857,11 +900,7 @@ class Application:
                     )
                     # Apply auto-discovery device_ref and overrides
                     config.device_ref = auto_cfg.device_ref
-                    for key, val in auto_cfg.options.items():
-                        if hasattr(config, key):
-                            setattr(config, key, val)
-                    if auto_cfg.update_interval is not None:
-                        config.update_interval = auto_cfg.update_interval
+                    auto_cfg.apply_overrides(config)
                     collectors.append(
                         ProcessCollector(
                             config=config,
@@ -871,63 +910,145 @@ class Application:
                             parent_device=parent_device,
                         )
                     )
-                    logger.debug(f"Auto-discovered process: {collector_name}")
+                    if debug:
+                        logger.debug("Auto-discovered process: %s", collector_name)
 
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
         except Exception as e:
-            logger.warning(f"Failed to list processes: {e}")
+            logger.warning("Failed to list processes: %s", e)
 
         if collectors:
-            logger.debug(f"Found {len(collectors)} processes")
+            logger.debug("Found %s processes", len(collectors))
 
         return collectors
 
     async def _initialize_collectors(self) -> None:
-        """Initialize all collectors and register sensors."""
-        for collector in self.collectors:
-            try:
-                await collector.initialize()
-                logger.info(f"Initialized collector: {collector.name}")
-
-                # Register sensors with Home Assistant
-                if self.config.homeassistant.discovery:
-                    await self.ha.register_sensors(collector.sensors)
-                    logger.debug(
-                        f"Registered {len(collector.sensors)} sensors for {collector.name}"
-                    )
-
-            except Exception as e:
-                logger.error(f"Failed to initialize collector {collector.name}: {e}")
+        """Initialize all collectors and register sensors, several at a time."""
+        discovery = self.config.homeassistant.discovery
 
-    async def _run_collector(self, collector: Collector) -> None:
-        """Run a single collector loop."""
+        async def initialize_one(collector: Collector) -> None:
+            async with self._collect_limit:
+                try:
+                    await collector.initialize()
+                    logger.info("Initialized collector: %s", collector.name)
+
+                    # Queue sensors for Home Assistant, registered below in one pass
+                    if discovery:
+                        self.ha.queue_sensors(collector.sensors)
+
+                except Exception as e:
+                    logger.error("Failed to initialize collector %s: %s", collector.name, e)
+
+        # initialize_one() handles its own errors, so one failure never cancels the group
+        async with asyncio.TaskGroup() as tg:
+            for collector in self.collectors.values():
+                tg.create_task(initialize_one(collector))
+
+        if discovery:
+            await self.ha.flush_sensors()
+
+    def _schedule_collector(self, collector: Collector, deadline: float) -> None:
+        """Queue the next collection cycle of a collector at the given loop time."""
+        seq = next(self._schedule_seq)
+        self._scheduled[collector.collector_key] = seq
+        heapq.heappush(self._schedule, (deadline, seq, collector))
+        self._schedule_changed.set()
+
+    def _start_collector(self, collector: Collector) -> None:
+        """Schedule a collector's first cycle to run immediately."""
+        # Topic never changes for a collector, so build it once
+        self._source_topics[collector.collector_key] = collector.source_topic(
+            self.config.mqtt.topic_prefix
+        )
         logger.info(
-            f"Starting collector [{collector.SOURCE_TYPE}]: {collector.name} (interval: {collector.update_interval}s)"
+            "Starting collector [%s]: %s (interval: %ss)",
+            collector.SOURCE_TYPE,
+            collector.name,
+            collector.update_interval,
         )
+        self._schedule_collector(collector, asyncio.get_running_loop().time())
+
+    async def _scheduler_loop(self) -> None:
+        """Dispatch collection cycles as their deadlines come due."""
+        loop = asyncio.get_running_loop()
+        heap = self._schedule
+        scheduled = self._scheduled
+        collector_tasks = self._collector_tasks
+        schedule_changed = self._schedule_changed
 
         while self._running:
-            try:
-                result = await collector.safe_collect()
+            if not heap:
+                schedule_changed.clear()
+                await schedule_changed.wait()
+                continue
 
-                # Get source topic (single JSON per source)
-                topic = collector.source_topic(self.config.mqtt.topic_prefix)
+            deadline, seq, collector = heap[0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                # Sleep until the earliest deadline, or until the schedule changes
+                schedule_changed.clear()
+                try:
+                    await asyncio.wait_for(schedule_changed.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(heap)
+            key = collector.collector_key
+            if scheduled.get(key) != seq:
+                continue  # Collector was removed or rescheduled
 
-                # Publish JSON data
-                await self.mqtt.publish_json(topic, result.to_json_dict())
+            # Next cycle on this interval's grid; missed slots are skipped
+            self._schedule_collector(collector, _next_slot(loop.time(), collector.update_interval))
+
+            # Skip this cycle if the previous one is still running
+            if key in collector_tasks:
+                continue
+
+            task = asyncio.create_task(self._run_collector(collector, self._source_topics[key]))
+            collector_tasks[key] = task
+            task.add_done_callback(functools.partial(self._collector_task_done, key))
+
+    def _collector_task_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished collection cycle (unless it was already replaced)."""
+        if self._collector_tasks.get(key) is task:
+            del self._collector_tasks[key]
+
+    async def _run_collector(self, collector: Collector, topic: str) -> None:
+        """Run one collection cycle and publish the result to the source topic."""
+        async with self._collect_limit:
+            try:
+                result = await collector.safe_collect()
+                data = result.to_json_dict()
+
+                # Publish JSON data (single JSON per source). With republish_unchanged set,
+                # data equal to the last publish is skipped until that much time has passed.
+                republish = self.config.defaults.republish_unchanged
+                if republish <= 0:
+                    await self.mqtt.publish_json(topic, data)
+                else:
+                    # After a reconnect the broker may have lost retained state: publish everything
+                    if self._published_connection != self.mqtt.connection_count:
+                        self._published_connection = self.mqtt.connection_count
+                        self._last_published.clear()
+                    now = asyncio.get_running_loop().time()
+                    last = self._last_published.get(collector.collector_key)
+                    if last is None or last[0] != data or now - last[1] >= republish:
+                        # Only a queued message counts as published; a dropped one is retried
+                        if await self.mqtt.publish_json(topic, data):
+                            self._last_published[collector.collector_key] = (dict(data), now)
 
                 if not result.available:
-                    logger.warning(f"Collector {collector.name} unavailable: {result.error}")
+                    logger.warning("Collector %s unavailable: %s", collector.name, result.error)
 
             except Exception as e:
-                logger.error(f"Error in collector {collector.name}: {e}")
-
-            await asyncio.sleep(collector.update_interval)
+                logger.error("Error in collector %s: %s", collector.name, e)
 
     async def _auto_refresh_loop(self, interval: float) -> None:
         """Periodically check for new/removed auto-discovered sources."""
-        logger.debug(f"Auto-refresh loop started (interval: {interval}s)")
+        logger.debug("Auto-refresh loop started (interval: %ss)", interval)
 
         while self._running:
             await asyncio.sleep(interval)
@@ -938,217 +1059,159 @@ class Application:
             try:
                 await self._refresh_auto_discovered()
             except Exception as e:
-                logger.error(f"Error during auto-refresh: {e}")
+                logger.error("Error during auto-refresh: %s", e)
+            finally:
+                # One state file write per refresh, however many collectors changed
+                self._flush_state()
 
     async def _refresh_auto_discovered(self) -> None:
         """Check for new/removed auto-discovered sources (services, containers, processes, temperatures, batteries, ac_power, disks)."""
         topic_prefix = self.config.mqtt.topic_prefix
 
-        # Get manually configured IDs (these should not be auto-removed)
-        manual_svc: set[str] = set()
-        manual_cont: set[str] = set()
-        manual_proc: set[str] = set()
-        for svc_cfg in self.config.services:
-            manual_svc.add(svc_cfg.name)
-        for cont_cfg in self.config.containers:
-            manual_cont.add(cont_cfg.name)
-        for proc_cfg in self.config.processes:
-            manual_proc.add(proc_cfg.name)
-
-        manual_temps: set[str] = {t.name for t in self.config.temperatures}
-        manual_batteries: set[str] = {b.name for b in self.config.batteries}
-        manual_ac_power: set[str] = {a.name for a in self.config.ac_power}
-        manual_disks: set[str] = {d.name for d in self.config.disks}
-        manual_networks: set[str] = {n.name for n in self.config.networks}
-        manual_fans: set[str] = {f.name for f in self.config.fans}
-
-        # Get system device from first system collector (if any)
-        system_device = None
-        for collector in self.collectors:
-            if collector.SOURCE_TYPE == "system" and collector.device:
-                system_device = collector.device
-                break
-
-        # --- Services, containers, processes ---
-        new_services = self._auto_discover_services(manual_svc, topic_prefix, system_device)
-        new_service_ids = {c.collector_id for c in new_services}
+        # Manually configured names (these should not be auto-removed)
+        manual = self._manual_names
+
+        system_device = self._system_device
+
+        # Temperatures, batteries, ac_power, disks, networks, fans:
+        # only rescan sources whose sysfs/procfs listing changed since the last complete scan
+        listings: dict[str, object] = {}  # source_type -> fingerprint, for rescanned sources
+        unchanged: set[str] = set()
+        for source_type, auto_cfg, path in (
+            (
+                "temperature",
+                self.config.auto_temperatures,
+                "/sys/class/thermal"
+                if self.config.auto_temperatures.source == "thermal"
+                else "/sys/class/hwmon",
+            ),
+            ("battery", self.config.auto_batteries, "/sys/class/power_supply"),
+            ("ac_power", self.config.auto_ac_powers, "/sys/class/power_supply"),
+            ("disk", self.config.auto_disks, "/proc/self/mounts"),
+            ("network", self.config.auto_networks, "/sys/class/net"),
+            ("fan", self.config.auto_fans, "/sys/class/hwmon"),
+        ):
+            if not auto_cfg.enabled:
+                continue
+            fingerprint = self._listing_fingerprint(path)
+            if fingerprint is not None and self._disc_fingerprints.get(source_type) == fingerprint:
+                unchanged.add(source_type)
+            else:
+                listings[source_type] = fingerprint
+
+        async def rescan(
+            source_type: str, discover: Callable[..., list[Collector]]
+        ) -> list[Collector] | None:
+            # None = source unchanged, keeps exactly its current auto-discovered collectors
+            if source_type in unchanged:
+                return None
+            return await asyncio.to_thread(
+                discover, manual[source_type], topic_prefix, system_device
+            )
 
-        new_containers = await self._auto_discover_containers(
-            manual_cont, topic_prefix, system_device
+        # All discoveries at once: D-Bus, Docker socket, and /proc and sysfs scans in threads
+        (
+            new_services,
+            new_containers,
+            new_processes,
+            new_temps,
+            new_batteries,
+            new_ac_power,
+            new_disks,
+            new_networks,
+            new_fans,
+        ) = await asyncio.gather(
+            self._auto_discover_services(manual["service"], topic_prefix, system_device),
+            self._auto_discover_containers(manual["docker"], topic_prefix, system_device),
+            asyncio.to_thread(
+                self._auto_discover_processes, manual["process"], topic_prefix, system_device
+            ),
+            rescan("temperature", self._auto_discover_temperatures),
+            rescan("battery", self._auto_discover_batteries),
+            rescan("ac_power", self._auto_discover_ac_power),
+            rescan("disk", self._auto_discover_disks),
+            rescan("network", self._auto_discover_networks),
+            rescan("fan", self._auto_discover_fans),
         )
-        new_container_ids = {c.collector_id for c in new_containers}
-
-        new_processes = self._auto_discover_processes(manual_proc, topic_prefix, system_device)
-        new_process_ids = {c.collector_id for c in new_processes}
 
-        auto_service_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "service" and c.collector_id not in manual_svc
-        }
-        auto_container_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "docker" and c.collector_id not in manual_cont
-        }
-        auto_process_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "process" and c.collector_id not in manual_proc
-        }
+        # Collect new and disappeared collectors
+        added: list[tuple[str, Collector]] = []
+        removed: list[tuple[str, set[str]]] = []
+        for source_type, label, discovered in (
+            ("service", "service", new_services),
+            ("docker", "container", new_containers),
+            ("process", "process", new_processes),
+            ("temperature", "temperature", new_temps),
+            ("battery", "battery", new_batteries),
+            ("ac_power", "AC power", new_ac_power),
+            ("disk", "disk", new_disks),
+            ("network", "network", new_networks),
+            ("fan", "fan", new_fans),
+        ):
+            if discovered is None:
+                continue
+            auto_keys = self._auto_keys[source_type]
+            new_by_key = {c.collector_key: c for c in discovered}
+            new_keys = new_by_key.keys()
+            if new_keys == auto_keys:
+                continue  # Steady state: nothing appeared or disappeared
+
+            # Set differences run in C; only the (few) added keys are visited in Python
+            if gone := auto_keys - new_keys:
+                removed.append((label, gone))
+            added.extend((label, new_by_key[key]) for key in new_keys - auto_keys)
+
+        failed: set[str] = set()  # Source types with a collector that could not be added
+        if added:
+            # Add new collectors, several at a time (initialization does I/O)
+            async def add_one(collector: Collector) -> None:
+                async with self._collect_limit:
+                    if not await self._add_collector(collector):
+                        failed.add(collector.SOURCE_TYPE)
+
+            async with asyncio.TaskGroup() as tg:
+                for _, collector in added:
+                    tg.create_task(add_one(collector))
+            for label, collector in added:
+                logger.info("Auto-discovered new %s: %s", label, collector.name)
+
+        if removed:
+            # Remove disappeared collectors (from JSON and Home Assistant) in one pass
+            await self._remove_collectors(key for _, keys in removed for key in keys)
+            for label, keys in removed:
+                for key in keys:
+                    logger.info("Removed disappeared %s: %s", label, key)
+
+        self._settle_listings(listings, failed)
+
+    @staticmethod
+    def _listing_fingerprint(path: str) -> object:
+        """Fingerprint of a discovery source's listing, or None if unreadable (always rescan)."""
+        try:
+            return _path_fingerprint(path)
+        except OSError:
+            return None
 
-        added_services = new_service_ids - auto_service_ids
-        removed_services = auto_service_ids - new_service_ids
-        added_containers = new_container_ids - auto_container_ids
-        removed_containers = auto_container_ids - new_container_ids
-        added_processes = new_process_ids - auto_process_ids
-        removed_processes = auto_process_ids - new_process_ids
-
-        # --- Temperatures, batteries, ac_power, disks ---
-        new_temps = self._auto_discover_temperatures(manual_temps, topic_prefix, system_device)
-        new_batteries = self._auto_discover_batteries(manual_batteries, topic_prefix, system_device)
-        new_ac_power = self._auto_discover_ac_power(manual_ac_power, topic_prefix, system_device)
-        new_disks = self._auto_discover_disks(manual_disks, topic_prefix, system_device)
-        new_networks = self._auto_discover_networks(manual_networks, topic_prefix, system_device)
-        new_fans = self._auto_discover_fans(manual_fans, topic_prefix, system_device)
-
-        new_temp_ids = {c.collector_id for c in new_temps}
-        new_battery_ids = {c.collector_id for c in new_batteries}
-        new_ac_power_ids = {c.collector_id for c in new_ac_power}
-        new_disk_ids = {c.collector_id for c in new_disks}
-        new_network_ids = {c.collector_id for c in new_networks}
-        new_fan_ids = {c.collector_id for c in new_fans}
-
-        auto_temp_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "temperature" and c.collector_id not in manual_temps
-        }
-        auto_battery_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "battery" and c.collector_id not in manual_batteries
-        }
-        auto_ac_power_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "ac_power" and c.collector_id not in manual_ac_power
-        }
-        auto_disk_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "disk" and c.collector_id not in manual_disks
-        }
-        auto_network_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "network" and c.collector_id not in manual_networks
-        }
-        auto_fan_ids = {
-            c.collector_id
-            for c in self.collectors
-            if c.SOURCE_TYPE == "fan" and c.collector_id not in manual_fans
-        }
+    def _settle_listings(self, listings: dict[str, object], failed: set[str]) -> None:
+        """
+        Trust the listings of rescanned sources once they are known to be complete.
 
-        removed_temps = auto_temp_ids - new_temp_ids
-        removed_batteries = auto_battery_ids - new_battery_ids
-        removed_ac_power = auto_ac_power_ids - new_ac_power_ids
-        removed_disks = auto_disk_ids - new_disk_ids
-        removed_networks = auto_network_ids - new_network_ids
-        removed_fans = auto_fan_ids - new_fan_ids
-
-        added_temps = new_temp_ids - auto_temp_ids
-        added_batteries = new_battery_ids - auto_battery_ids
-        added_ac_power = new_ac_power_ids - auto_ac_power_ids
-        added_disks = new_disk_ids - auto_disk_ids
-        added_networks = new_network_ids - auto_network_ids
-        added_fans = new_fan_ids - auto_fan_ids
-
-        # Add new collectors
-        for collector in new_services:
-            if collector.collector_id in added_services:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new service: {collector.name}")
-
-        for collector in new_containers:
-            if collector.collector_id in added_containers:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new container: {collector.name}")
-
-        for collector in new_processes:
-            if collector.collector_id in added_processes:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new process: {collector.name}")
-
-        for collector in new_temps:
-            if collector.collector_id in added_temps:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new temperature: {collector.name}")
-
-        for collector in new_batteries:
-            if collector.collector_id in added_batteries:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new battery: {collector.name}")
-
-        for collector in new_ac_power:
-            if collector.collector_id in added_ac_power:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new AC power: {collector.name}")
-
-        for collector in new_disks:
-            if collector.collector_id in added_disks:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new disk: {collector.name}")
-
-        for collector in new_networks:
-            if collector.collector_id in added_networks:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new network: {collector.name}")
-
-        for collector in new_fans:
-            if collector.collector_id in added_fans:
-                await self._add_collector(collector)
-                logger.info(f"Auto-discovered new fan: {collector.name}")
-
-        # Remove disappeared collectors (from JSON and Home Assistant)
-        for collector_id in removed_services:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared service: {collector_id}")
-
-        for collector_id in removed_containers:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared container: {collector_id}")
-
-        for collector_id in removed_processes:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared process: {collector_id}")
-
-        for collector_id in removed_temps:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared temperature: {collector_id}")
-
-        for collector_id in removed_batteries:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared battery: {collector_id}")
-
-        for collector_id in removed_ac_power:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared AC power: {collector_id}")
-
-        for collector_id in removed_disks:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared disk: {collector_id}")
-
-        for collector_id in removed_networks:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared network: {collector_id}")
-
-        for collector_id in removed_fans:
-            await self._remove_collector(collector_id)
-            logger.info(f"Removed disappeared fan: {collector_id}")
-
-    async def _add_collector(self, collector: Collector) -> None:
-        """Add and start a new collector."""
+        A listing is trusted (later refreshes skip the rescan) only when all of its
+        collectors were added and it did not change since the previous rescan. A
+        hot-plugged entry often appears before its attribute files can be read, so
+        the rescan right after a change may miss it; the next one picks it up.
+        """
+        for source_type, fingerprint in listings.items():
+            if (
+                fingerprint is not None
+                and source_type not in failed
+                and self._disc_listings.get(source_type) == fingerprint
+            ):
+                self._disc_fingerprints[source_type] = fingerprint
+            self._disc_listings[source_type] = fingerprint
+
+    async def _add_collector(self, collector: Collector) -> bool:
+        """Add and start a new collector. Returns False if it could not be added."""
         try:
             await collector.initialize()
 
@@ -1156,58 +1219,83 @@ class Application:
             if self.config.homeassistant.discovery:
                 await self.ha.register_sensors(collector.sensors)
 
-            # Add to list
-            self.collectors.append(collector)
+            # Add to collectors
+            self.collectors[collector.collector_key] = collector
+            if collector.SOURCE_TYPE == "system" and self._system_device is None:
+                self._system_device = collector.device
+            if collector.SOURCE_TYPE in self._auto_keys:
+                self._auto_keys[collector.SOURCE_TYPE].add(collector.collector_key)
 
-            # Start task
-            task = asyncio.create_task(self._run_collector(collector))
-            self._tasks.append(task)
-            self._collector_tasks[collector.collector_id] = task
+            # Schedule collection
+            self._start_collector(collector)
 
-            # Save state
-            self.ha._save_state()
+            self._state_dirty = True
+            return True
 
         except Exception as e:
-            logger.error(f"Failed to add collector {collector.name}: {e}")
-
-    async def _remove_collector(self, collector_id: str) -> None:
-        """Stop and remove a collector. Clears HA entities and JSON source topic."""
-        # Find collector
-        collector = None
-        for c in self.collectors:
-            if c.collector_id == collector_id:
-                collector = c
-                break
+            logger.error("Failed to add collector %s: %s", collector.name, e)
+            return False
 
-        if not collector:
+    async def _remove_collectors(self, keys: Iterable[str]) -> None:
+        """Stop and remove collectors by key. Clears HA entities and JSON source topics."""
+        collectors = [c for key in keys if (c := self.collectors.pop(key, None))]
+        if not collectors:
             return
 
-        # Cancel task
-        task = self._collector_tasks.get(collector_id)
-        if task:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            self._tasks.remove(task)
-            del self._collector_tasks[collector_id]
+        # Unschedule (heap entries become stale), then cancel in-flight cycles together
+        tasks = []
+        for collector in collectors:
+            self._auto_keys.get(collector.SOURCE_TYPE, set()).discard(collector.collector_key)
+            self._scheduled.pop(collector.collector_key, None)
+            self._last_published.pop(collector.collector_key, None)
+            task = self._collector_tasks.pop(collector.collector_key, None)
+            if task:
+                task.cancel()
+                tasks.append(task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for collector in collectors:
+            collector.close()
+
+        # A system collector went away: take the system device from the first remaining one
+        if any(c.SOURCE_TYPE == "system" for c in collectors):
+            self._system_device = next(
+                (
+                    c.device
+                    for c in self.collectors.values()
+                    if c.SOURCE_TYPE == "system" and c.device
+                ),
+                None,
+            )
 
-        # Clear JSON source topic (so retained message does not show stale data)
-        source_topic = collector.source_topic(self.config.mqtt.topic_prefix)
-        await self.mqtt.publish(source_topic, "", qos=1, retain=True)
+        # Clear JSON source topics (so retained messages do not show stale data)
+        topic_prefix = self.config.mqtt.topic_prefix
+        await self.mqtt.publish_many(
+            [
+                (
+                    self._source_topics.pop(
+                        collector.collector_key, collector.source_topic(topic_prefix)
+                    ),
+                    "",
+                )
+                for collector in collectors
+            ],
+            qos=1,
+            retain=True,
+        )
 
-        # Remove sensors from Home Assistant (use entity_type: sensor vs binary_sensor)
-        if self.config.homeassistant.discovery:
-            for sensor in collector.sensors:
-                await self.ha.unregister_sensor(sensor)
+        # Remove sensors from Home Assistant (also forgets them in the registered set)
+        await self.ha.unregister_sensors(
+            sensor for collector in collectors for sensor in collector.sensors
+        )
 
-        # Remove from list
-        self.collectors.remove(collector)
+        self._state_dirty = True
 
-        # Update state file
-        self.ha._registered_sensors -= {s.unique_id for s in collector.sensors}
-        self.ha._save_state()
+    def _flush_state(self) -> None:
+        """Save the HA state file if collectors were added or removed since the last save."""
+        if self._state_dirty:
+            self._state_dirty = False
+            self.ha._save_state()
 
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
@@ -1225,9 +1313,19 @@ class Application:
         """Start the application."""
         logger.info("Starting Penguin Metrics")
 
+        # Python 3.12+: tasks run eagerly up to their first real suspension, so
+        # collection cycles and initializations that finish without I/O skip a loop pass
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         # Create collectors
-        self.collectors = await self._create_collectors()
-        logger.info(f"Created {len(self.collectors)} collectors")
+        # Index by key and partition auto-discovered collectors by type in one pass
+        for collector in await self._create_collectors():
+            self.collectors[collector.collector_key] = collector
+            manual = self._manual_names.get(collector.SOURCE_TYPE)
+            if manual is not None and collector.collector_id not in manual:
+                self._auto_keys[collector.SOURCE_TYPE].add(collector.collector_key)
+        logger.info("Created %s collectors", len(self.collectors))
 
         # Start MQTT client
         await self.mqtt.start()
@@ -1248,19 +1346,18 @@ class Application:
         # Setup signal handlers
         self._setup_signal_handlers()
 
-        # Start collector tasks
+        # Schedule collectors and start the scheduler
         self._running = True
-        for collector in self.collectors:
-            task = asyncio.create_task(self._run_collector(collector))
-            self._tasks.append(task)
-            self._collector_tasks[collector.collector_id] = task
+        for collector in self.collectors.values():
+            self._start_collector(collector)
+        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
         # Start auto-refresh task if enabled
         refresh_interval = self.config.auto_refresh_interval
         if refresh_interval > 0:
             self._refresh_task = asyncio.create_task(self._auto_refresh_loop(refresh_interval))
             logger.info(
-                f"Auto-refresh enabled: checking for new/removed sources every {refresh_interval}s"
+                "Auto-refresh enabled: checking for new/removed sources every %ss", refresh_interval
             )
 
         logger.info("Penguin Metrics started successfully")
@@ -1277,23 +1374,30 @@ class Application:
 
         self._running = False
 
-        # Cancel refresh task
-        if self._refresh_task:
-            self._refresh_task.cancel()
-            try:
-                await self._refresh_task
-            except asyncio.CancelledError:
-                pass
-
-        # Cancel collector tasks
-        for task in self._tasks:
+        # Cancel auto-refresh, the scheduler and in-flight collection cycles together
+        # (all cancelled before the first await, so none can start new work)
+        tasks = [
+            task
+            for task in (self._refresh_task, self._scheduler_task, *self._collector_tasks.values())
+            if task is not None and not task.done()
+        ]
+        self._refresh_task = None
+        self._scheduler_task = None
+
+        for task in tasks:
             task.cancel()
 
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        self._tasks.clear()
         self._collector_tasks.clear()
+        for collector in self.collectors.values():
+            collector.close()
+        self._schedule.clear()
+        self._scheduled.clear()
+        self._source_topics.clear()
+        self._last_published.clear()
+        self._systemd_units.close()
 
         # Note: LWT (Last Will and Testament) automatically publishes offline status
         # to {prefix}/status when connection is lost, making all sensors unavailable
@@ -1310,53 +1414,62 @@ class Application:
         except KeyboardInterrupt:
             pass
         except Exception as e:
-            logger.error(f"Application error: {e}")
+            logger.error("Application error: %s", e)
             raise
 
 
-async def run_app(config_path: str, cli_log_config: LogConfig | None = None) -> None:
+async def run_app(
+    config_path: str,
+    cli_log_config: LogConfig | None = None,
+    config: Config | None = None,
+    loader: ConfigLoader | None = None,
+) -> None:
     """
     Load configuration and run the application.
 
     Args:
         config_path: Path to configuration file
         cli_log_config: Logging config from CLI args (overrides file config)
+        config: Configuration already loaded from config_path by `loader`
+        loader: Loader that loaded `config` (used for validation)
     """
-    # Load configuration
-    loader = ConfigLoader()
-    config = loader.load_file(config_path)
-
-    # Setup logging from config file (unless CLI overrides)
+    # Load configuration, unless the caller already did
+    if config is None or loader is None:
+        loader = ConfigLoader()
+        config = loader.load_file(config_path)
+
+    # Setup logging from config file; CLI args override it, but file settings
+    # from the config are merged in when the CLI does not enable a log file
+    log_cfg = config.logging
+    file_settings: _LogFileSettings = {
+        "file_enabled": log_cfg.file is not None,
+        "file_path": log_cfg.file or "/var/log/penguin-metrics/penguin-metrics.log",
+        "file_level": log_cfg.file_level,
+        "file_max_bytes": log_cfg.file_max_size * 1024 * 1024,
+        "file_backup_count": log_cfg.file_keep,
+    }
     if cli_log_config is None:
         log_config = LogConfig(
-            console_level=config.logging.level,
-            console_colors=config.logging.colors,
-            file_enabled=config.logging.file is not None,
-            file_path=config.logging.file or "/var/log/penguin-metrics/penguin-metrics.log",
-            file_level=config.logging.file_level,
-            file_max_bytes=config.logging.file_max_size * 1024 * 1024,
-            file_backup_count=config.logging.file_keep,
-            format=config.logging.format,
+            console_level=log_cfg.level,
+            console_colors=log_cfg.colors,
+            format=log_cfg.format,
+            **file_settings,
         )
-        setup_logging(log_config)
+    elif not cli_log_config.file_enabled and log_cfg.file:
+        log_config = dataclasses.replace(cli_log_config, **file_settings)
     else:
-        # CLI args override file config, but merge file settings if not specified
-        if not cli_log_config.file_enabled and config.logging.file:
-            cli_log_config.file_enabled = True
-            cli_log_config.file_path = config.logging.file
-            cli_log_config.file_level = config.logging.file_level
-            cli_log_config.file_max_bytes = config.logging.file_max_size * 1024 * 1024
-            cli_log_config.file_backup_count = config.logging.file_keep
-        setup_logging(cli_log_config)
-
-    logger.info(f"Loaded configuration from {config_path}")
-    logger.debug(f"MQTT: {config.mqtt.host}:{config.mqtt.port}")
-    logger.debug(f"Topic prefix: {config.mqtt.topic_prefix}")
+        log_config = cli_log_config
+    setup_logging(log_config)
+
+    logger.info("Loaded configuration from %s", config_path)
+    logger.debug("MQTT: %s:%s", config.mqtt.host, config.mqtt.port)
+    logger.debug("Topic prefix: %s", config.mqtt.topic_prefix)
+    logger.debug("Event loop: %s", type(asyncio.get_running_loop()).__module__)
 
     # Validate configuration
     warnings = loader.validate(config)
     for warning in warnings:
-        logger.warning(f"Config warning: {warning}")
+        logger.warning("Config warning: %s", warning)
 
     # Create and run application
     app = Application(config)
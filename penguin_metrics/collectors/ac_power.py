@@ -6,6 +6,7 @@ Publishes AC power connection status (online boolean) for use as a binary sensor
 Also provides auto-discovery helpers for power supplies under /sys/class/power_supply.
 """
 
+import os
 from pathlib import Path
 from typing import NamedTuple
 
@@ -23,6 +24,33 @@ class PowerSupplyInfo(NamedTuple):
     type: str
 
 
+def scan_power_supplies() -> list[tuple[str, str, str]]:
+    """
+    List devices under /sys/class/power_supply with their type.
+
+    Returns:
+        Sorted list of (name, sysfs path, lowercased type) tuples
+    """
+    try:
+        with os.scandir("/sys/class/power_supply") as it:
+            entries = sorted((entry.name, entry.path) for entry in it)
+    except OSError:
+        return []
+
+    supplies: list[tuple[str, str, str]] = []
+    for name, path in entries:
+        try:
+            with open(f"{path}/type") as f:
+                device_type = f.read().strip().lower()
+        except FileNotFoundError:
+            device_type = ""
+        except OSError:
+            continue
+        supplies.append((name, path, device_type))
+
+    return supplies
+
+
 def discover_ac_power() -> list[PowerSupplyInfo]:
     """
     Discover non-battery power supplies from /sys/class/power_supply.
@@ -31,27 +59,16 @@ def discover_ac_power() -> list[PowerSupplyInfo]:
         List of PowerSupplyInfo for non-battery devices (e.g. AC, mains, USB).
     """
     devices: list[PowerSupplyInfo] = []
-    power_supply = Path("/sys/class/power_supply")
-
-    if not power_supply.exists():
-        return devices
-
-    for device in sorted(power_supply.iterdir()):
-        type_file = device / "type"
-
-        try:
-            device_type = type_file.read_text().strip().lower() if type_file.exists() else ""
-        except Exception:
-            continue
 
+    for name, path, device_type in scan_power_supplies():
         # Skip actual batteries; everything else is treated as external power
         if device_type == "battery":
             continue
 
         devices.append(
             PowerSupplyInfo(
-                name=device.name,
-                path=device,
+                name=name,
+                path=Path(path),
                 type=device_type,
             )
         )
@@ -80,7 +97,9 @@ class ACPowerCollector(Collector):
     """
     Collector for external AC power supply status.
 
-    Reads from /sys/class/power_supply/<name>/online.
+    Reads from /sys/class/power_supply/<name>/online. The file is opened once
+    and re-read with pread(); it is reopened after a failed read (e.g. the
+    supply was unplugged and came back).
     """
 
     SOURCE_TYPE = "ac_power"
@@ -115,6 +134,9 @@ class ACPowerCollector(Collector):
             # Fallback to block name
             self._sysfs_path = Path("/sys/class/power_supply") / config.name
 
+        self._online_path = str(self._sysfs_path / "online")
+        self._online_fd: int | None = None
+
     def create_device(self) -> Device | None:
         """Create device for AC power sensor."""
         return create_device_from_ref(
@@ -151,10 +173,26 @@ class ACPowerCollector(Collector):
         )
         return [sensor]
 
+    def _read_online(self) -> int | None:
+        """Read the 'online' value through the kept-open sysfs file (see read_online)."""
+        try:
+            if self._online_fd is None:
+                self._online_fd = os.open(self._online_path, os.O_RDONLY)
+            return 1 if os.pread(self._online_fd, 2, 0)[:1] == b"1" else 0
+        except OSError:
+            self.close()
+            return None
+
+    def close(self) -> None:
+        """Close the sysfs 'online' file."""
+        if self._online_fd is not None:
+            os.close(self._online_fd)
+            self._online_fd = None
+
     async def collect(self) -> CollectorResult:
         """Read AC online state from sysfs."""
         result = CollectorResult()
-        value = read_online(self._sysfs_path)
+        value = self._read_online()
 
         if value is None:
             result.set_unavailable("not_found")
@@ -16,9 +16,9 @@ from ..models.device import Device
 from ..models.sensor import Sensor, SensorState, create_sensor
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectorResult:
-    """Result of a collection cycle."""
+    """Result of a collection cycle (one per cycle, so slotted to keep it small)."""
 
     # Data dict for JSON publication (key -> value)
     data: dict[str, Any] = field(default_factory=dict)
@@ -101,6 +101,8 @@ class Collector(ABC):
         """
         self.name = name
         self.collector_id = collector_id or self._sanitize_id(name)
+        # Unique across source types (a process and a container may share an ID)
+        self.collector_key = f"{self.SOURCE_TYPE}:{self.collector_id}"
         self.update_interval = update_interval
         self.enabled = enabled
         self.topic_prefix = topic_prefix
@@ -178,6 +180,15 @@ class Collector(ABC):
         self._sensors = self.create_sensors()
         self._initialized = True
 
+    def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """
+        Release resources kept open between collections.
+
+        Called when the collector is removed and on shutdown. Override if
+        collect() keeps file descriptors or handles open.
+        """
+        pass
+
     @abstractmethod
     def create_device(self) -> Device | None:
         """
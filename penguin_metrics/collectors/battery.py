@@ -22,6 +22,7 @@ from typing import NamedTuple
 from ..config.schema import BatteryConfig, BatteryMatchType, DefaultsConfig, DeviceConfig
 from ..models.device import Device, create_device_from_ref
 from ..models.sensor import BinarySensorDeviceClass, DeviceClass, Sensor, StateClass, create_sensor
+from .ac_power import scan_power_supplies
 from .base import Collector, CollectorResult, apply_overrides_to_sensors, build_sensor
 
 
@@ -41,24 +42,13 @@ def discover_batteries() -> list[BatteryInfo]:
         List of BatteryInfo for battery devices
     """
     batteries: list[BatteryInfo] = []
-    power_supply = Path("/sys/class/power_supply")
-
-    if not power_supply.exists():
-        return batteries
-
-    for device in sorted(power_supply.iterdir()):
-        type_file = device / "type"
-
-        try:
-            device_type = type_file.read_text().strip().lower() if type_file.exists() else ""
-        except Exception:
-            continue
 
+    for name, path, device_type in scan_power_supplies():
         if device_type == "battery":
             batteries.append(
                 BatteryInfo(
-                    name=device.name,
-                    path=device,
+                    name=name,
+                    path=Path(path),
                     type=device_type,
                 )
             )
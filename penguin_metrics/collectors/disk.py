@@ -11,6 +11,7 @@ Collects:
 - Usage percentage (%)
 """
 
+import asyncio
 from pathlib import Path
 from typing import NamedTuple
 
@@ -240,7 +241,8 @@ class DiskCollector(Collector):
             return result
 
         try:
-            usage = psutil.disk_usage(disk.mountpoint)
+            # statvfs() can hang on an unresponsive network mount: keep it off the event loop
+            usage = await asyncio.to_thread(psutil.disk_usage, disk.mountpoint)
         except (OSError, PermissionError) as e:
             result.set_error(str(e))
             result.set_unavailable("error")
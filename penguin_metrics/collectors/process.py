@@ -16,6 +16,7 @@ Collects:
 - Thread count
 """
 
+import asyncio
 import logging
 import re
 import time
@@ -408,16 +409,17 @@ class ProcessCollector(MultiSourceCollector):
         match_type = self.config.match.type
         match_value = self.config.match.value
 
+        # name/pattern/cmdline matches walk all of /proc: run them off the event loop
         if match_type == ProcessMatchType.NAME:
-            processes = find_processes_by_name(str(match_value))
+            processes = await asyncio.to_thread(find_processes_by_name, str(match_value))
         elif match_type == ProcessMatchType.PATTERN:
-            processes = find_processes_by_pattern(str(match_value))
+            processes = await asyncio.to_thread(find_processes_by_pattern, str(match_value))
         elif match_type == ProcessMatchType.PID:
             processes = find_process_by_pid(int(match_value))
         elif match_type == ProcessMatchType.PIDFILE:
             processes = find_process_by_pidfile(str(match_value))
         elif match_type == ProcessMatchType.CMDLINE:
-            processes = find_processes_by_cmdline(str(match_value))
+            processes = await asyncio.to_thread(find_processes_by_cmdline, str(match_value))
         else:
             processes = []
 
@@ -30,6 +30,9 @@ from ..utils.cgroup import (
 from ..utils.smaps import aggregate_smaps
 from .base import Collector, CollectorResult, build_sensor
 
+# Seconds to wait for a systemctl invocation before killing it
+SYSTEMCTL_TIMEOUT = 10
+
 
 async def run_systemctl(*args: str) -> tuple[int, str]:
     """
@@ -37,6 +40,9 @@ async def run_systemctl(*args: str) -> tuple[int, str]:
 
     Returns:
         Tuple of (exit_code, output)
+
+    Raises:
+        TimeoutError: systemctl did not finish within SYSTEMCTL_TIMEOUT seconds
     """
     proc = await asyncio.create_subprocess_exec(
         "systemctl",
@@ -44,7 +50,13 @@ async def run_systemctl(*args: str) -> tuple[int, str]:
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.STDOUT,
     )
-    stdout, _ = await proc.communicate()
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=SYSTEMCTL_TIMEOUT)
+    except TimeoutError:
+        # A hung systemctl (e.g. D-Bus stalled) must not wedge the collection cycle
+        proc.kill()
+        await proc.wait()
+        raise
     return proc.returncode or 0, stdout.decode().strip()
 
 
@@ -5,6 +5,7 @@ Reads temperature from /sys/class/thermal/thermal_zone*/temp
 and from psutil's sensors_temperatures() for hwmon sensors.
 """
 
+import os
 from pathlib import Path
 from typing import Any, NamedTuple
 
@@ -38,27 +39,29 @@ def discover_thermal_zones() -> list[ThermalZone]:
         List of ThermalZone tuples
     """
     zones: list[ThermalZone] = []
-    thermal_path = Path("/sys/class/thermal")
 
-    if not thermal_path.exists():
+    try:
+        with os.scandir("/sys/class/thermal") as it:
+            zone_dirs = sorted(
+                (entry.name, entry.path) for entry in it if entry.name.startswith("thermal_zone")
+            )
+    except OSError:
         return zones
 
-    for zone_dir in sorted(thermal_path.glob("thermal_zone*")):
-        type_file = zone_dir / "type"
-        temp_file = zone_dir / "temp"
-
-        if not temp_file.exists():
+    for name, path in zone_dirs:
+        if not os.path.exists(f"{path}/temp"):
             continue
 
         try:
-            zone_type = type_file.read_text().strip() if type_file.exists() else zone_dir.name
-        except Exception:
-            zone_type = zone_dir.name
+            with open(f"{path}/type") as f:
+                zone_type = f.read().strip()
+        except OSError:
+            zone_type = name
 
         zones.append(
             ThermalZone(
-                name=zone_dir.name,
-                path=zone_dir,
+                name=name,
+                path=Path(path),
                 type=zone_type,
             )
         )
@@ -10,10 +10,14 @@ Supports:
 - Include directives with glob patterns
 """
 
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
 
+# Run of whitespace, newlines included
+_WHITESPACE_RE = re.compile(r"[ \t\r\n]+")
+
 
 class TokenType(Enum):
     """Token types for the nginx-like config syntax."""
@@ -128,36 +132,36 @@ class Lexer:
 
         return char
 
+    def _jump(self, end: int) -> None:
+        """Move to position end in one step, keeping line/column tracking."""
+        newlines = self.source.count("\n", self.pos, end)
+        if newlines:
+            self.line += newlines
+            self.line_start = self.source.rindex("\n", self.pos, end) + 1
+        self.pos = end
+        self.column = end - self.line_start + 1
+
     def _skip_whitespace(self) -> None:
         """Skip whitespace characters (but not newlines for error tracking)."""
-        char = self._current()
-        while char and char in " \t\r\n":
-            self._advance()
-            char = self._current()
+        match = _WHITESPACE_RE.match(self.source, self.pos)
+        if match is not None:
+            self._jump(match.end())
 
     def _skip_comment(self) -> bool:
         """Skip single-line or multi-line comment. Returns True if skipped."""
         if self._current() == "#":
-            # Single-line comment
-            while self._current() and self._current() != "\n":
-                self._advance()
+            # Single-line comment, up to (not including) the newline
+            end = self.source.find("\n", self.pos)
+            self._jump(len(self.source) if end < 0 else end)
             return True
 
         if self._current() == "/" and self._peek() == "*":
             # Multi-line comment
-            start_line = self.line
-            start_col = self.column
-            self._advance()  # skip /
-            self._advance()  # skip *
-
-            while self.pos < len(self.source):
-                if self._current() == "*" and self._peek() == "/":
-                    self._advance()  # skip *
-                    self._advance()  # skip /
-                    return True
-                self._advance()
-
-            raise LexerError("Unterminated multi-line comment", start_line, start_col)
+            end = self.source.find("*/", self.pos + 2)
+            if end < 0:
+                raise LexerError("Unterminated multi-line comment", self.line, self.column)
+            self._jump(end + 2)
+            return True
 
         return False
 
@@ -106,7 +106,7 @@ class ConfigLoader:
             raise ConfigError(f"Failed to load configuration: {e}") from e
 
     # Known top-level directives (not in blocks)
-    KNOWN_TOP_LEVEL = {"auto_refresh_interval"}
+    KNOWN_TOP_LEVEL = {"auto_refresh_interval", "event_loop"}
 
     # Valid sub-block types inside auto_discovery { ... }
     _AUTO_DISCOVERY_SUB_BLOCKS = {
@@ -139,6 +139,8 @@ class ConfigLoader:
             "capath",
             "certfile",
             "keyfile",
+            "batch_window",
+            "max_batch_bytes",
         },
         "homeassistant": {
             "discovery",
@@ -148,6 +150,7 @@ class ConfigLoader:
         "defaults": {
             "update_interval",
             "smaps",
+            "republish_unchanged",
             "system",
             "process",
             "service",
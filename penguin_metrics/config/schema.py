@@ -4,7 +4,9 @@ Configuration schema with dataclasses for validation and type safety.
 Defines all configuration sections, their fields, defaults, and validation.
 """
 
-from dataclasses import dataclass, field
+import fnmatch
+import re
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any, TypeVar
 
@@ -129,6 +131,9 @@ class DeviceConfig:
     # All fields (including name, manufacturer, model, etc.) go to extra_fields
     extra_fields: dict[str, Any] = field(default_factory=dict)
 
+    # Devices built from this template, shared by collectors (see create_device_from_ref)
+    _devices: dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     @classmethod
     def from_block(cls, block: Block | None) -> "DeviceConfig":
         """Create DeviceConfig from a parsed 'device' block."""
@@ -175,6 +180,9 @@ class MQTTConfig:
     capath: str | None = None  # CA certificates directory
     certfile: str | None = None  # Client certificate file
     keyfile: str | None = None  # Client private key file
+    # Publish batching
+    batch_window: float = 0.0  # Seconds to wait for more messages before flushing a batch
+    max_batch_bytes: int = 65536  # Payload byte budget per batch
 
     @classmethod
     def from_block(cls, block: Block | None) -> "MQTTConfig":
@@ -215,6 +223,8 @@ class MQTTConfig:
             capath=block.get_value("capath"),
             certfile=block.get_value("certfile"),
             keyfile=block.get_value("keyfile"),
+            batch_window=float(block.get_value("batch_window", 0.0)),
+            max_batch_bytes=int(block.get_value("max_batch_bytes", 65536)),
         )
 
     def should_retain(self) -> bool:
@@ -604,6 +614,8 @@ class DefaultsConfig:
 
     update_interval: float = 10.0  # seconds
     smaps: bool = False
+    # Unchanged source data is published again only after this long (0 = every cycle)
+    republish_unchanged: float = 0.0  # seconds
 
     # Per-source-type defaults
     # Note: system defaults removed - system block appears only once
@@ -625,9 +637,14 @@ class DefaultsConfig:
         if isinstance(interval, str):
             interval = 10.0
 
+        republish = block.get_value("republish_unchanged", 0.0)
+        if isinstance(republish, str):
+            republish = 0.0
+
         return cls(
             update_interval=float(interval),
             smaps=bool(block.get_value("smaps", False)),
+            republish_unchanged=float(republish),
             # system defaults removed - system block appears only once
             process=ProcessDefaultsConfig.from_block(block.get_block("process")),
             service=ServiceDefaultsConfig.from_block(block.get_block("service")),
@@ -672,6 +689,26 @@ class AutoDiscoveryConfig:
     # Extra boolean options to override per-source defaults (e.g., current off)
     options: dict[str, bool] = field(default_factory=dict)
 
+    # filters/excludes compiled into one alternation regex each (None = no patterns)
+    _filter_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    _exclude_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    # options narrowed to the fields of each source config class, filled on first use
+    _options_by_type: dict[type, dict[str, bool]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile glob patterns once."""
+        self._filter_re = self._compile_globs(self.filters)
+        self._exclude_re = self._compile_globs(self.excludes)
+
+    @staticmethod
+    def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+        """Translate glob patterns into a single regex matching any of them."""
+        if not patterns:
+            return None
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
     @classmethod
     def from_block(cls, block: Block | None) -> "AutoDiscoveryConfig":
         """Create AutoDiscoveryConfig from a parsed block."""
@@ -742,23 +779,33 @@ class AutoDiscoveryConfig:
         Returns:
             True if name should be included
         """
-        import fnmatch
-
         # Check excludes first - if any matches, exclude
-        for pattern in self.excludes:
-            if fnmatch.fnmatch(name, pattern):
-                return False
+        if self._exclude_re is not None and self._exclude_re.match(name):
+            return False
 
         # Check filters - if any matches, include
-        if self.filters:
-            for pattern in self.filters:
-                if fnmatch.fnmatch(name, pattern):
-                    return True
-            return False  # Has filters but none matched
+        if self._filter_re is not None:
+            return self._filter_re.match(name) is not None
 
         # No filters = include all (that weren't excluded)
         return True
 
+    def options_for(self, config_cls: type) -> dict[str, bool]:
+        """Return the options that name a field of config_cls (cached per class)."""
+        options = self._options_by_type.get(config_cls)
+        if options is None:
+            names = {f.name for f in fields(config_cls)}
+            options = {key: val for key, val in self.options.items() if key in names}
+            self._options_by_type[config_cls] = options
+        return options
+
+    def apply_overrides(self, config: Any) -> None:
+        """Apply option and update_interval overrides to a discovered source config."""
+        for key, val in self.options_for(type(config)).items():
+            setattr(config, key, val)
+        if self.update_interval is not None:
+            config.update_interval = self.update_interval
+
     def bool_override(self, name: str) -> bool | None:
         """Return boolean override if specified in auto-discovery block."""
         return self.options.get(name)
@@ -1955,6 +2002,7 @@ class Config:
 
     # Global settings
     auto_refresh_interval: float = 0  # seconds, 0 = disabled
+    event_loop: str = "auto"  # auto (uvloop if installed), uvloop, asyncio
 
     # Device templates for grouping sensors
     device_templates: dict[str, DeviceConfig] = field(default_factory=dict)
@@ -2009,6 +2057,11 @@ class Config:
             refresh = 0
         config.auto_refresh_interval = float(refresh)
 
+        event_loop = doc.get_value("event_loop", "auto")
+        if event_loop not in ("auto", "uvloop", "asyncio"):
+            event_loop = "auto"
+        config.event_loop = event_loop
+
         # Parse global blocks
         config.mqtt = MQTTConfig.from_block(doc.get_block("mqtt"))
         config.homeassistant = HomeAssistantConfig.from_block(doc.get_block("homeassistant"))
@@ -9,8 +9,10 @@ Features:
 - Structured logging format
 """
 
+import copy
 import logging
 import logging.handlers
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -160,6 +162,10 @@ def get_log_level(level_str: str) -> int:
     return levels.get(level_str.lower(), logging.INFO)
 
 
+# Snapshot of the LogConfig most recently applied by setup_logging()
+_active_config: LogConfig | None = None
+
+
 def setup_logging(config: LogConfig | None = None) -> None:
     """
     Configure logging for the application.
@@ -167,18 +173,39 @@ def setup_logging(config: LogConfig | None = None) -> None:
     Args:
         config: Logging configuration (uses defaults if None)
     """
+    global _active_config
+
     if config is None:
         config = LogConfig()
 
     # Get root logger for penguin_metrics
     root_logger = logging.getLogger("penguin_metrics")
-    root_logger.setLevel(logging.DEBUG)  # Capture all, filter at handlers
 
-    # Remove existing handlers
+    # Nothing to do if this exact configuration is already installed
+    if config == _active_config and root_logger.handlers:
+        return
+
+    # Reuse handlers from a previous call (e.g. CLI startup) instead of rebuilding them
+    console_handler: logging.StreamHandler | None = None
+    file_handler: logging.handlers.RotatingFileHandler | None = None
+    for handler in root_logger.handlers:
+        if isinstance(handler, logging.handlers.RotatingFileHandler):
+            if (
+                config.file_enabled
+                and handler.baseFilename == os.path.abspath(config.file_path)
+                and handler.maxBytes == config.file_max_bytes
+                and handler.backupCount == config.file_backup_count
+            ):
+                file_handler = handler
+            else:
+                handler.close()
+        elif isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout:
+            console_handler = handler
     root_logger.handlers.clear()
 
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    if console_handler is None:
+        console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(get_log_level(config.console_level))
 
     # Use colored formatter if colors enabled and stdout is a TTY
@@ -193,15 +220,16 @@ def setup_logging(config: LogConfig | None = None) -> None:
 
     # File handler
     if config.file_enabled:
-        # Ensure log directory exists
-        log_path = Path(config.file_path)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            config.file_path,
-            maxBytes=config.file_max_bytes,
-            backupCount=config.file_backup_count,
-        )
+        if file_handler is None:
+            # Ensure log directory exists
+            log_path = Path(config.file_path)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+
+            file_handler = logging.handlers.RotatingFileHandler(
+                config.file_path,
+                maxBytes=config.file_max_bytes,
+                backupCount=config.file_backup_count,
+            )
         file_handler.setLevel(get_log_level(config.file_level))
 
         file_formatter = PlainFormatter(
@@ -211,6 +239,10 @@ def setup_logging(config: LogConfig | None = None) -> None:
         file_handler.setFormatter(file_formatter)
         root_logger.addHandler(file_handler)
 
+    # Pass through exactly what the most verbose handler keeps, so that
+    # logger.isEnabledFor() and disabled debug calls short-circuit early
+    root_logger.setLevel(min(handler.level for handler in root_logger.handlers))
+
     # Apply per-module levels
     if config.module_levels:
         for module_name, level_str in config.module_levels.items():
@@ -221,6 +253,8 @@ def setup_logging(config: LogConfig | None = None) -> None:
     logging.getLogger("aiomqtt").setLevel(logging.WARNING)
     logging.getLogger("paho").setLevel(logging.WARNING)
 
+    _active_config = copy.deepcopy(config)
+
 
 def setup_logging_from_args(
     verbose: bool = False,
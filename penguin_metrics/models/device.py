@@ -204,6 +204,9 @@ def create_device_from_ref(
     """
     Shared helper to resolve device_ref logic across collectors.
 
+    Devices built from a template are memoized on the template (per parent
+    device), so collectors referencing the same template share one instance.
+
     Args:
         device_ref: Requested device reference ("system"/"auto"/"none"/template/None)
         source_type: Collector source type (system, process, etc.)
@@ -226,11 +229,19 @@ def create_device_from_ref(
     if device_ref and device_ref not in ("system", "auto", "none"):
         if device_ref in templates:
             template = templates[device_ref]
-            device = Device(
-                identifiers=template.identifiers.copy(),
-                extra_fields=template.extra_fields.copy() if template.extra_fields else {},
+            # One Device per template and parent, shared by every collector using it
+            key = (
+                parent_device.primary_identifier if parent_device else None,
+                source_type == "system",  # System devices never get via_device
             )
-            _add_via_device_if_needed(device, parent_device, source_type)
+            device = template._devices.get(key)
+            if device is None:
+                device = Device(
+                    identifiers=template.identifiers.copy(),
+                    extra_fields=template.extra_fields.copy() if template.extra_fields else {},
+                )
+                _add_via_device_if_needed(device, parent_device, source_type)
+                template._devices[key] = device
             return device
 
     if use_parent_as_default and parent_device:
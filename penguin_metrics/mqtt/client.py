@@ -12,7 +12,7 @@ import asyncio
 import json
 import ssl
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -21,8 +21,46 @@ import aiomqtt
 from ..config.schema import MQTTConfig
 from ..logging import get_logger
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # Optional: pip install penguin-metrics[fast]
+    _HAS_ORJSON = False
+
 logger = get_logger("mqtt.client")
 
+# Queued message: (topic, payload, qos, retain)
+_Message = tuple[str, str | bytes, int, bool]
+
+# Batches that may await broker acks at the same time
+MAX_INFLIGHT_BATCHES = 4
+
+# Fallback encoder, built once; compact UTF-8 output like orjson's
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(data: Any) -> str | bytes:
+    """Serialize to JSON, using orjson (bytes) when it is installed."""
+    if _HAS_ORJSON:
+        try:
+            encoded: bytes = orjson.dumps(data)
+            return encoded
+        except TypeError:
+            pass  # Types orjson rejects (e.g. ints over 64 bits) go through json
+    return _json_encoder.encode(data)
+
+
+def _encode_payload(payload: Any) -> str | bytes:
+    """Convert a payload to str, or bytes when JSON comes from orjson."""
+    if isinstance(payload, str):
+        return payload
+    elif isinstance(payload, (int, float)):
+        return str(payload)
+    elif isinstance(payload, bool):
+        return "true" if payload else "false"
+    return _dumps(payload)
+
 
 class MQTTClient:
     """
@@ -50,6 +88,7 @@ class MQTTClient:
         # Connection state
         self._client: aiomqtt.Client | None = None
         self._connected = False
+        self._connection_count = 0  # Successful connects, so callers can detect reconnects
         self._reconnect_interval = 5.0
         self._max_reconnect_interval = 60.0
 
@@ -57,12 +96,14 @@ class MQTTClient:
         self._client_id = config.client_id or f"penguin_metrics_{uuid.uuid4().hex[:8]}"
 
         # Message queue for offline buffering (large enough for many collectors)
-        self._message_queue: asyncio.Queue[tuple[str, str, int, bool]] = asyncio.Queue(
-            maxsize=10000
-        )
+        self._message_queue: asyncio.Queue[_Message] = asyncio.Queue(maxsize=10000)
+        # Unsent messages of failed batches (topic -> message), sent before the queue
+        self._pending: dict[str, _Message] = {}
 
         # Background tasks
         self._publisher_task: asyncio.Task | None = None
+        self._inflight_batches: set[asyncio.Task] = set()
+        self._batch_slots = asyncio.Semaphore(MAX_INFLIGHT_BATCHES)
         self._running = False
 
     @property
@@ -70,6 +111,11 @@ class MQTTClient:
         """Check if client is connected."""
         return self._connected
 
+    @property
+    def connection_count(self) -> int:
+        """Number of successful connections so far; changes on every reconnect."""
+        return self._connection_count
+
     @property
     def topic_prefix(self) -> str:
         """Get configured topic prefix."""
@@ -131,12 +177,15 @@ class MQTTClient:
             aiomqtt.MqttError: If connection fails
         """
         scheme = "mqtts" if self.config.tls else "mqtt"
-        logger.debug(f"Connecting to MQTT broker {scheme}://{self.config.host}:{self.config.port}")
-        logger.debug(f"Client ID: {self._client_id}")
+        logger.debug(
+            "Connecting to MQTT broker %s://%s:%s", scheme, self.config.host, self.config.port
+        )
+        logger.debug("Client ID: %s", self._client_id)
 
         self._client = self._create_client()
         await self._client.__aenter__()
         self._connected = True
+        self._connection_count += 1
 
         # Publish online status
         await self._publish_raw(
@@ -147,8 +196,10 @@ class MQTTClient:
         )
 
         scheme = "mqtts" if self.config.tls else "mqtt"
-        logger.info(f"Connected to MQTT broker at {scheme}://{self.config.host}:{self.config.port}")
-        logger.debug(f"Availability topic: {self.availability_topic}")
+        logger.info(
+            "Connected to MQTT broker at %s://%s:%s", scheme, self.config.host, self.config.port
+        )
+        logger.debug("Availability topic: %s", self.availability_topic)
 
     async def disconnect(self) -> None:
         """Disconnect from MQTT broker."""
@@ -176,16 +227,20 @@ class MQTTClient:
     async def _publish_raw(
         self,
         topic: str,
-        payload: str,
+        payload: str | bytes,
         qos: int = 1,
         retain: bool = False,
     ) -> None:
-        """Publish a message directly (internal use)."""
-        if self._client and self._connected:
-            logger.debug(
-                f"Publishing to {topic}: {payload[:100]}{'...' if len(payload) > 100 else ''}"
-            )
-            await self._client.publish(topic, payload, qos=qos, retain=retain)
+        """
+        Publish a message directly (internal use).
+
+        Raises:
+            aiomqtt.MqttError: If not connected, so callers re-queue the message
+        """
+        if not (self._client and self._connected):
+            raise aiomqtt.MqttError("Not connected to MQTT broker")
+        logger.debug("Publishing to %s: %.100s", topic, payload)
+        await self._client.publish(topic, payload, qos=qos, retain=retain)
 
     async def publish(
         self,
@@ -194,7 +249,7 @@ class MQTTClient:
         qos: int | None = None,
         retain: bool | None = None,
         is_status: bool = False,
-    ) -> None:
+    ) -> bool:
         """
         Publish a message to a topic.
 
@@ -204,7 +259,59 @@ class MQTTClient:
             qos: QoS level (default from config)
             retain: Retain flag (None = use config mode)
             is_status: If True, this is a status/availability message
+
+        Returns:
+            True if the message was queued, False if it was dropped
+        """
+        qos, retain = self._resolve_flags(qos, retain, is_status)
+        return await self._enqueue((topic, _encode_payload(payload), qos, retain))
+
+    async def publish_many(
+        self,
+        messages: Iterable[tuple[str, Any]],
+        qos: int | None = None,
+        retain: bool | None = None,
+    ) -> None:
+        """
+        Queue several messages at once.
+
+        They are enqueued back to back, so the publisher sends them in the
+        same batch rather than interleaved with other traffic.
+
+        Args:
+            messages: (topic, payload) pairs; payloads are encoded as in publish()
+            qos: QoS level (default from config)
+            retain: Retain flag (None = use config mode)
+        """
+        qos, retain = self._resolve_flags(qos, retain, False)
+        for topic, payload in messages:
+            await self._enqueue((topic, _encode_payload(payload), qos, retain))
+
+    async def _enqueue(self, message: _Message) -> bool:
         """
+        Add a message to the publish queue, waiting up to 5s if it is full.
+
+        Returns:
+            True if the message was queued, False if it was dropped
+        """
+        # Fast path: no wait_for() wrapper task while the queue has room (the usual case)
+        try:
+            self._message_queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        try:
+            await asyncio.wait_for(self._message_queue.put(message), timeout=5.0)
+        except TimeoutError:
+            logger.warning("Message queue full for 5s, dropping message to %s", message[0])
+            return False
+        return True
+
+    def _resolve_flags(
+        self, qos: int | None, retain: bool | None, is_status: bool
+    ) -> tuple[int, bool]:
+        """Fill in QoS and retain defaults from config."""
         if qos is None:
             qos = self.config.qos
 
@@ -215,24 +322,7 @@ class MQTTClient:
             else:
                 retain = self.config.should_retain()
 
-        # Convert payload to string
-        if isinstance(payload, str):
-            payload_str = payload
-        elif isinstance(payload, (int, float)):
-            payload_str = str(payload)
-        elif isinstance(payload, bool):
-            payload_str = "true" if payload else "false"
-        else:
-            payload_str = json.dumps(payload)
-
-        # Add to queue (wait if full, with timeout)
-        try:
-            await asyncio.wait_for(
-                self._message_queue.put((topic, payload_str, qos, retain)),
-                timeout=5.0,
-            )
-        except TimeoutError:
-            logger.warning(f"Message queue full for 5s, dropping message to {topic}")
+        return qos, retain
 
     async def publish_data(
         self,
@@ -272,7 +362,7 @@ class MQTTClient:
         data: dict[str, Any],
         qos: int | None = None,
         retain: bool | None = None,
-    ) -> None:
+    ) -> bool:
         """
         Publish a JSON message to a topic.
 
@@ -281,8 +371,106 @@ class MQTTClient:
             data: Dictionary to encode as JSON
             qos: QoS level
             retain: Retain flag
+
+        Returns:
+            True if the message was queued, False if it was dropped
+        """
+        return await self.publish(topic, data, qos, retain)
+
+    async def _collect_batch(self, first: _Message | None) -> list[_Message]:
+        """
+        Drain pending and queued messages into a batch.
+
+        Waits up to the configured batch window for more messages, then takes
+        re-queued messages of failed batches (older than anything queued), the
+        already dequeued one and whatever is queued, until the byte budget is
+        reached. Only the newest message per topic is kept.
+
+        Args:
+            first: Message that triggered the batch (None = sending pending messages)
+
+        Returns:
+            Messages to publish, in queue order
+        """
+        if self.config.batch_window > 0:
+            await asyncio.sleep(self.config.batch_window)
+
+        max_bytes = self.config.max_batch_bytes
+        pending = self._pending
+        batch: dict[str, _Message] = {}
+        size = 0
+        while pending and size < max_bytes:
+            held = pending.pop(next(iter(pending)))
+            batch[held[0]] = held
+            size += len(held[1])
+
+        queue = self._message_queue
+        message = first
+        while message is not None or (size < max_bytes and not queue.empty()):
+            if message is None:
+                message = queue.get_nowait()
+            # Newer payload supersedes an older (or re-queued) one for the same topic
+            pending.pop(message[0], None)
+            batch.pop(message[0], None)
+            batch[message[0]] = message
+            size += len(message[1])
+            message = None
+
+        return list(batch.values())
+
+    async def _publish_batch(self, batch: list[_Message]) -> list[_Message]:
+        """
+        Publish a batch of messages back-to-back without waiting for each ack.
+
+        Args:
+            batch: Messages to publish
+
+        Returns:
+            Messages that failed with an MQTT error (empty on success)
+        """
+        results = await asyncio.gather(
+            *(self._publish_raw(*message) for message in batch),
+            return_exceptions=True,
+        )
+
+        failed: list[_Message] = []
+        for message, result in zip(batch, results, strict=True):
+            if isinstance(result, aiomqtt.MqttError):
+                logger.error("MQTT error: %s", result)
+                failed.append(message)
+            elif isinstance(result, BaseException):
+                raise result
+        return failed
+
+    def _requeue(self, messages: list[_Message]) -> None:
         """
-        await self.publish(topic, data, qos, retain)
+        Hold unsent messages for the next batch.
+
+        They go ahead of the queue rather than behind it: a newer message for the
+        same topic may already be queued, and must still supersede them.
+        """
+        for message in messages:
+            self._pending[message[0]] = message
+
+    async def _send_batch(self, batch: list[_Message]) -> None:
+        """Publish a batch, re-queueing it if the connection failed."""
+        try:
+            failed = await self._publish_batch(batch)
+        except Exception as e:
+            logger.error("Publisher loop error: %s", e)
+            self._connected = False
+            self._requeue(batch)
+            return
+
+        if failed:
+            self._connected = False
+            # Re-queue the messages that were not sent
+            self._requeue(failed)
+
+    def _batch_done(self, task: asyncio.Task) -> None:
+        """Free the in-flight slot of a finished batch."""
+        self._inflight_batches.discard(task)
+        self._batch_slots.release()
 
     async def _publisher_loop(self) -> None:
         """Background task to publish queued messages."""
@@ -295,7 +483,7 @@ class MQTTClient:
                         await self.connect()
                         reconnect_interval = self._reconnect_interval
                     except Exception as e:
-                        logger.error(f"Failed to connect to MQTT: {e}")
+                        logger.error("Failed to connect to MQTT: %s", e)
                         await asyncio.sleep(reconnect_interval)
                         reconnect_interval = min(
                             reconnect_interval * 2,
@@ -303,26 +491,33 @@ class MQTTClient:
                         )
                         continue
 
-                # Process messages from queue
-                try:
-                    topic, payload, qos, retain = await asyncio.wait_for(
-                        self._message_queue.get(),
-                        timeout=1.0,
-                    )
-                    await self._publish_raw(topic, payload, qos, retain)
-                except TimeoutError:
-                    continue
-                except aiomqtt.MqttError as e:
-                    logger.error(f"MQTT error: {e}")
-                    self._connected = False
-                    # Re-queue the message
+                # Process messages from queue (re-queued ones first, without waiting)
+                first: _Message | None = None
+                if not self._pending:
                     try:
-                        self._message_queue.put_nowait((topic, payload, qos, retain))
-                    except asyncio.QueueFull:
-                        pass
+                        first = await asyncio.wait_for(
+                            self._message_queue.get(),
+                            timeout=1.0,
+                        )
+                    except TimeoutError:
+                        continue
+
+                batch = await self._collect_batch(first)
+
+                # Don't wait for this batch's acks before collecting the next one:
+                # a slow ack only holds back its own batch
+                await self._batch_slots.acquire()
+                if not self._connected:
+                    # An in-flight batch failed meanwhile: hold this one until reconnected
+                    self._batch_slots.release()
+                    self._requeue(batch)
+                    continue
+                task = asyncio.create_task(self._send_batch(batch))
+                self._inflight_batches.add(task)
+                task.add_done_callback(self._batch_done)
 
             except Exception as e:
-                logger.error(f"Publisher loop error: {e}")
+                logger.error("Publisher loop error: %s", e)
                 self._connected = False
                 await asyncio.sleep(1.0)
 
@@ -343,6 +538,11 @@ class MQTTClient:
             except asyncio.CancelledError:
                 pass
 
+        for task in self._inflight_batches:
+            task.cancel()
+        if self._inflight_batches:
+            await asyncio.gather(*self._inflight_batches, return_exceptions=True)
+
         await self.disconnect()
         logger.info("MQTT client stopped")
 
@@ -11,6 +11,7 @@ Handles:
 
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +26,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_STATE_FILE = "/var/lib/penguin-metrics/registered_sensors.json"
 
 
+def discovery_topic(prefix: str, entity_type: str, unique_id: str) -> str:
+    """Discovery config topic of an entity: <prefix>/<entity_type>/<unique_id>/config."""
+    return f"{prefix}/{entity_type}/{unique_id}/config"
+
+
 class HomeAssistantDiscovery:
     """
     Home Assistant MQTT Discovery handler.
@@ -51,22 +57,33 @@ class HomeAssistantDiscovery:
         self.config = config
         self.state_file = Path(state_file) if state_file else Path(DEFAULT_STATE_FILE)
 
-        # Track registered entities (current session)
-        self._registered_sensors: set[str] = set()
+        # Track registered entities (current session): unique_id -> entity_type
+        self._registered_sensors: dict[str, str] = {}
         self._registered_devices: set[str] = set()
 
-        # Previously registered sensors (from state file)
-        self._previous_sensors: set[str] = set()
+        # Previously registered sensors (from state file): unique_id -> entity_type,
+        # or None when the state file predates entity types
+        self._previous_sensors: dict[str, str | None] = self._load_state()
+
+        # Sensors waiting for flush_sensors(), keyed by unique_id
+        self._pending_sensors: dict[str, Sensor] = {}
 
-    def _load_state(self) -> set[str]:
+    @staticmethod
+    def _parse_state(data: dict[str, Any]) -> dict[str, str | None]:
+        """Get unique_id -> entity_type from state file data (old files list ids only)."""
+        sensors = data.get("sensors", [])
+        if isinstance(sensors, dict):
+            return dict(sensors)
+        return dict.fromkeys(sensors)
+
+    def _load_state(self) -> dict[str, str | None]:
         """Load previously registered sensors from state file."""
         # Try primary location
         try:
             if self.state_file.exists():
-                data = json.loads(self.state_file.read_text())
-                return set(data.get("sensors", []))
+                return self._parse_state(json.loads(self.state_file.read_text()))
         except Exception as e:
-            logger.debug(f"Could not load primary state file: {e}")
+            logger.debug("Could not load primary state file: %s", e)
 
         # Try fallback location
         fallback = Path.home() / ".penguin-metrics" / "registered_sensors.json"
@@ -74,32 +91,32 @@ class HomeAssistantDiscovery:
             if fallback.exists():
                 data = json.loads(fallback.read_text())
                 self.state_file = fallback  # Use fallback for future operations
-                return set(data.get("sensors", []))
+                return self._parse_state(data)
         except Exception as e:
-            logger.debug(f"Could not load fallback state file: {e}")
+            logger.debug("Could not load fallback state file: %s", e)
 
-        return set()
+        return {}
 
     def _save_state(self) -> None:
         """Save registered sensors to state file."""
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            data = {"sensors": list(self._registered_sensors)}
+            data = {"sensors": self._registered_sensors}
             self.state_file.write_text(json.dumps(data, indent=2))
-            logger.debug(f"Saved {len(self._registered_sensors)} sensors to state file")
+            logger.debug("Saved %s sensors to state file", len(self._registered_sensors))
         except PermissionError:
             # Try fallback to user's home directory
             fallback = Path.home() / ".penguin-metrics" / "registered_sensors.json"
             try:
                 fallback.parent.mkdir(parents=True, exist_ok=True)
-                data = {"sensors": list(self._registered_sensors)}
+                data = {"sensors": self._registered_sensors}
                 fallback.write_text(json.dumps(data, indent=2))
-                logger.debug(f"Saved state to fallback: {fallback}")
+                logger.debug("Saved state to fallback: %s", fallback)
                 self.state_file = fallback  # Use fallback for future operations
             except Exception as e:
-                logger.warning(f"Failed to save state file (fallback): {e}")
+                logger.warning("Failed to save state file (fallback): %s", e)
         except Exception as e:
-            logger.warning(f"Failed to save state file: {e}")
+            logger.warning("Failed to save state file: %s", e)
 
     async def cleanup_stale_sensors(self) -> int:
         """
@@ -108,32 +125,32 @@ class HomeAssistantDiscovery:
         Returns:
             Number of sensors removed
         """
-        self._previous_sensors = self._load_state()
-
         if not self._previous_sensors:
             logger.debug("No previous sensors found in state file")
             return 0
 
         logger.debug(
-            f"Previous session had {len(self._previous_sensors)} sensors, "
-            f"current session has {len(self._registered_sensors)} sensors"
+            "Previous session had %s sensors, current session has %s sensors",
+            len(self._previous_sensors),
+            len(self._registered_sensors),
         )
 
         # Find sensors that were registered before but not now
-        stale = self._previous_sensors - self._registered_sensors
+        stale = self._previous_sensors.keys() - self._registered_sensors.keys()
 
         if not stale:
             logger.debug("No stale sensors to clean up")
             return 0
 
-        logger.info(f"Cleaning up {len(stale)} stale sensors from Home Assistant")
+        logger.info("Cleaning up %s stale sensors from Home Assistant", len(stale))
 
         for sensor_id in stale:
             # Publish empty payload to remove sensor from HA
-            # Try both sensor and binary_sensor (we don't know which it was)
-            for entity_type in ("sensor", "binary_sensor"):
+            # Old state files lack the entity type: try both sensor and binary_sensor
+            known_type = self._previous_sensors[sensor_id]
+            for entity_type in (known_type,) if known_type else ("sensor", "binary_sensor"):
                 await self._clear_discovery(sensor_id, entity_type)
-            logger.info(f"Removed stale sensor: {sensor_id}")
+            logger.info("Removed stale sensor: %s", sensor_id)
 
         return len(stale)
 
@@ -145,7 +162,7 @@ class HomeAssistantDiscovery:
         """
         removed = await self.cleanup_stale_sensors()
         if removed:
-            logger.info(f"Removed {removed} stale sensors from previous session")
+            logger.info("Removed %s stale sensors from previous session", removed)
 
         self._save_state()
 
@@ -164,11 +181,11 @@ class HomeAssistantDiscovery:
         Returns:
             Discovery topic string
         """
-        return f"{self.discovery_prefix}/{sensor.entity_type}/{sensor.unique_id}/config"
+        return discovery_topic(self.discovery_prefix, sensor.entity_type, sensor.unique_id)
 
     async def _clear_discovery(self, sensor_id: str, entity_type: str = "sensor") -> None:
         """Publish empty payload to remove discovery for given sensor/entity type."""
-        topic = f"{self.discovery_prefix}/{entity_type}/{sensor_id}/config"
+        topic = discovery_topic(self.discovery_prefix, entity_type, sensor_id)
         await self.mqtt.publish(topic, "", qos=1, retain=True)
 
     def _build_discovery_payload(self, sensor: Sensor) -> dict[str, Any]:
@@ -198,6 +215,8 @@ class HomeAssistantDiscovery:
 
         Clears the other entity type (sensor vs binary_sensor) for the same
         unique_id first, so a renamed/migrated entity does not leave a duplicate.
+        The clear is skipped when the state file shows the unique_id was already
+        registered with this entity type.
 
         Args:
             sensor: Sensor to register
@@ -205,16 +224,17 @@ class HomeAssistantDiscovery:
         if not self.config.discovery:
             return
 
-        other_type = "binary_sensor" if sensor.entity_type == "sensor" else "sensor"
-        await self._clear_discovery(sensor.unique_id, other_type)
+        if self._previous_sensors.get(sensor.unique_id) != sensor.entity_type:
+            other_type = "binary_sensor" if sensor.entity_type == "sensor" else "sensor"
+            await self._clear_discovery(sensor.unique_id, other_type)
 
         topic = self._get_discovery_topic(sensor)
         payload = self._build_discovery_payload(sensor)
 
         await self.mqtt.publish_json(topic, payload, qos=1, retain=True)
-        self._registered_sensors.add(sensor.unique_id)
+        self._registered_sensors[sensor.unique_id] = sensor.entity_type
 
-        logger.debug(f"Registered sensor: {sensor.unique_id}")
+        logger.debug("Registered sensor: %s", sensor.unique_id)
 
     async def unregister_sensor(self, sensor: Sensor) -> None:
         """
@@ -229,9 +249,9 @@ class HomeAssistantDiscovery:
             return
 
         await self._clear_discovery(sensor.unique_id, sensor.entity_type)
-        self._registered_sensors.discard(sensor.unique_id)
+        self._registered_sensors.pop(sensor.unique_id, None)
 
-        logger.debug(f"Unregistered sensor: {sensor.unique_id}")
+        logger.debug("Unregistered sensor: %s", sensor.unique_id)
 
     async def register_sensors(self, sensors: list[Sensor]) -> None:
         """
@@ -240,8 +260,90 @@ class HomeAssistantDiscovery:
         Args:
             sensors: List of sensors to register
         """
+        if not self.config.discovery:
+            return
+
+        # Same messages as register_sensor(), queued in one burst
+        prefix = self.discovery_prefix
+        build_payload = self._build_discovery_payload
+        previous = self._previous_sensors
+        messages: list[tuple[str, Any]] = []
+        append = messages.append
+        for sensor in sensors:
+            unique_id = sensor.unique_id
+            entity_type = sensor.entity_type
+            if previous.get(unique_id) != entity_type:
+                other_type = "binary_sensor" if entity_type == "sensor" else "sensor"
+                append((discovery_topic(prefix, other_type, unique_id), ""))
+            append((discovery_topic(prefix, entity_type, unique_id), build_payload(sensor)))
+
+        await self.mqtt.publish_many(messages, qos=1, retain=True)
+        self._registered_sensors.update(
+            (sensor.unique_id, sensor.entity_type) for sensor in sensors
+        )
+
+        logger.debug("Registered %s sensors", len(sensors))
+
+    async def unregister_sensors(self, sensors: Iterable[Sensor]) -> None:
+        """
+        Unregister multiple sensors.
+
+        Args:
+            sensors: Sensors to unregister
+        """
+        if not self.config.discovery:
+            return
+
+        # Same messages as unregister_sensor(), queued in one burst
+        prefix = self.discovery_prefix
+        sensors = list(sensors)
+        await self.mqtt.publish_many(
+            [(discovery_topic(prefix, s.entity_type, s.unique_id), "") for s in sensors],
+            qos=1,
+            retain=True,
+        )
+        for sensor in sensors:
+            self._registered_sensors.pop(sensor.unique_id, None)
+
+        logger.debug("Unregistered %s sensors", len(sensors))
+
+    def queue_sensors(self, sensors: Iterable[Sensor]) -> None:
+        """
+        Queue sensors for registration by flush_sensors().
+
+        A sensor queued again under the same unique_id replaces the earlier one.
+
+        Args:
+            sensors: Sensors to register
+        """
         for sensor in sensors:
-            await self.register_sensor(sensor)
+            self._pending_sensors[sensor.unique_id] = sensor
+
+    async def flush_sensors(self) -> int:
+        """
+        Register all queued sensors, one device at a time.
+
+        Publishing each device's entities back to back lets the MQTT publisher
+        send them in the same batch, and HA creates the device complete.
+
+        Returns:
+            Number of sensors registered
+        """
+        pending = self._pending_sensors
+        self._pending_sensors = {}
+        if not self.config.discovery or not pending:
+            return 0
+
+        by_device: dict[str, list[Sensor]] = {}
+        for sensor in pending.values():
+            device_id = sensor.device.primary_identifier if sensor.device else ""
+            by_device.setdefault(device_id, []).append(sensor)
+
+        for sensors in by_device.values():
+            await self.register_sensors(sensors)
+
+        logger.debug("Registered %s sensors for %s devices", len(pending), len(by_device))
+        return len(pending)
 
     async def publish_sensor_state(self, sensor: Sensor) -> None:
         """
@@ -294,9 +396,8 @@ class HomeAssistantDiscovery:
 
         Sends empty payloads to remove all entities from Home Assistant.
         """
-        for sensor_id in list(self._registered_sensors):
-            await self._clear_discovery(sensor_id, "sensor")
-            await self._clear_discovery(sensor_id, "binary_sensor")
+        for sensor_id, entity_type in list(self._registered_sensors.items()):
+            await self._clear_discovery(sensor_id, entity_type)
 
         self._registered_sensors.clear()
         self._registered_devices.clear()
@@ -318,7 +419,7 @@ def build_sensor_discovery(
     Returns:
         Tuple of (topic, payload)
     """
-    topic = f"{discovery_prefix}/{sensor.entity_type}/{sensor.unique_id}/config"
+    topic = discovery_topic(discovery_prefix, sensor.entity_type, sensor.unique_id)
 
     payload = sensor.to_discovery_dict(discovery_prefix)
     payload["origin"] = {
@@ -285,6 +285,34 @@ class DockerClient:
 
         return containers
 
+    async def list_container_names(
+        self,
+        all: bool = False,
+        filters: dict[str, list[str]] | None = None,
+    ) -> list[str]:
+        """
+        List Docker container names only.
+
+        Cheaper than list_containers() when only names are needed: no
+        ContainerInfo objects or health parsing for each entry.
+
+        Args:
+            all: Include stopped containers
+            filters: Server-side filters (status, label, etc.)
+
+        Returns:
+            List of container names (without leading slash)
+        """
+        query: dict[str, str] = {}
+        if all:
+            query["all"] = "true"
+        if filters:
+            query["filters"] = json.dumps(filters)
+
+        data = await self._get_json("/containers/json", query)
+
+        return [item["Names"][0].lstrip("/") for item in data or () if item.get("Names")]
+
     async def get_container(self, container_id: str) -> ContainerInfo | None:
         """
         Get container info by ID or name.
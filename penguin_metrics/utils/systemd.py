@@ -0,0 +1,174 @@
+"""
+Systemd unit listing.
+
+Lists loaded service units through systemd's D-Bus API when the optional
+dbus-fast package is installed, falling back to `systemctl list-units`.
+"""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from collections.abc import Sequence
+
+try:
+    from dbus_fast import BusType, Message, MessageType
+    from dbus_fast.aio import MessageBus
+except ImportError:  # Optional dependency: fall back to systemctl
+    MessageBus = None
+
+logger = logging.getLogger(__name__)
+
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_PATH = "/org/freedesktop/systemd1"
+SYSTEMD_MANAGER = "org.freedesktop.systemd1.Manager"
+
+# Manager signals that change the set of loaded units
+_UNIT_SIGNALS = frozenset({"UnitNew", "UnitRemoved"})
+_MATCH_RULE = f"type='signal',sender='{SYSTEMD_BUS_NAME}',interface='{SYSTEMD_MANAGER}'"
+
+# Backoff before retrying D-Bus after a failure, doubled per failure up to the max
+DBUS_RETRY_MIN = 30.0
+DBUS_RETRY_MAX = 600.0
+
+# Unit name (first column) of `systemctl list-units --plain --no-legend` output
+_SERVICE_UNIT_RE = re.compile(rb"^\s*(\S+\.service)\s", re.MULTILINE)
+
+
+class SystemdUnits:
+    """
+    Cached list of loaded systemd service units.
+
+    With dbus-fast, ListUnitsByPatterns is called once per pattern set and
+    again only after systemd signals UnitNew/UnitRemoved. Without it (or if
+    the system bus is not reachable), every call runs `systemctl list-units`.
+    After other D-Bus errors, systemctl is used until a backoff expires.
+    """
+
+    def __init__(self) -> None:
+        """Initialize unit lister."""
+        self._bus: MessageBus | None = None
+        self._cache: dict[tuple[str, ...], list[str]] = {}  # patterns -> unit names
+        # Monotonic time from which D-Bus is tried again (inf = never: no dbus-fast or no bus)
+        self._dbus_retry_at = math.inf if MessageBus is None else 0.0
+        self._dbus_backoff = DBUS_RETRY_MIN
+
+    async def list_services(self, patterns: Sequence[str] = ()) -> list[str]:
+        """
+        List loaded service units (all states).
+
+        Args:
+            patterns: Shell-style unit name globs; systemd filters units by them
+                before replying (empty = all units)
+
+        Returns:
+            Unit names including the .service suffix
+        """
+        key = tuple(patterns)
+        if self._bus is not None and self._bus.connected and key in self._cache:
+            return self._cache[key]
+
+        now = time.monotonic()
+        if now >= self._dbus_retry_at:
+            try:
+                units = await self._list_dbus(key)
+                self._cache[key] = units
+                self._dbus_backoff = DBUS_RETRY_MIN
+                return units
+            except FileNotFoundError as e:
+                # No system bus socket: it will not appear later
+                logger.debug("systemd D-Bus not available, using systemctl: %s", e)
+                self._dbus_retry_at = math.inf
+                self.close()
+            except Exception as e:
+                logger.debug(
+                    "systemd D-Bus failed, using systemctl for %.0fs: %s", self._dbus_backoff, e
+                )
+                self._dbus_retry_at = now + self._dbus_backoff
+                self._dbus_backoff = min(self._dbus_backoff * 2, DBUS_RETRY_MAX)
+                self.close()
+
+        return await self._list_systemctl(key)
+
+    def close(self) -> None:
+        """Disconnect from the system bus."""
+        if self._bus is not None:
+            self._bus.disconnect()
+            self._bus = None
+        self._cache.clear()
+
+    async def _call(self, message: "Message") -> "Message":
+        """Call a D-Bus method, raising on an error reply."""
+        if self._bus is None:
+            raise RuntimeError("Not connected to the system bus")
+        reply = await self._bus.call(message)
+        if reply.message_type == MessageType.ERROR:
+            raise RuntimeError(f"{reply.error_name}: {reply.body[0] if reply.body else ''}")
+        return reply
+
+    async def _list_dbus(self, patterns: tuple[str, ...]) -> list[str]:
+        """List service units via org.freedesktop.systemd1.Manager.ListUnitsByPatterns."""
+        if self._bus is None or not self._bus.connected:
+            self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+            self._bus.add_message_handler(self._on_message)
+            await self._call(
+                Message(
+                    destination="org.freedesktop.DBus",
+                    path="/org/freedesktop/DBus",
+                    interface="org.freedesktop.DBus",
+                    member="AddMatch",
+                    signature="s",
+                    body=[_MATCH_RULE],
+                )
+            )
+            # systemd only emits unit signals to subscribed clients
+            await self._call(self._manager_call("Subscribe"))
+
+        # Any unit state; only units matching the patterns
+        reply = await self._call(
+            self._manager_call("ListUnitsByPatterns", "asas", [[], list(patterns)])
+        )
+        return [unit[0] for unit in reply.body[0] if unit[0].endswith(".service")]
+
+    @staticmethod
+    def _manager_call(member: str, signature: str = "", body: list | None = None) -> "Message":
+        """Build a method call on the systemd manager object."""
+        return Message(
+            destination=SYSTEMD_BUS_NAME,
+            path=SYSTEMD_PATH,
+            interface=SYSTEMD_MANAGER,
+            member=member,
+            signature=signature,
+            body=body or [],
+        )
+
+    def _on_message(self, message: "Message") -> None:
+        """Invalidate the cache when units are loaded or unloaded."""
+        if message.message_type == MessageType.SIGNAL and message.member in _UNIT_SIGNALS:
+            self._cache.clear()
+
+    @staticmethod
+    async def _list_systemctl(patterns: tuple[str, ...]) -> list[str]:
+        """List service units via `systemctl list-units`."""
+        # --plain drops the status glyph column
+        proc = await asyncio.create_subprocess_exec(
+            "systemctl",
+            "list-units",
+            "--type=service",
+            "--no-legend",
+            "--all",
+            "--plain",
+            "--",
+            *patterns,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        return [unit.decode(errors="replace") for unit in _SERVICE_UNIT_RE.findall(stdout)]
@@ -0,0 +1,69 @@
+"""
+Tests for the AC power collector's kept-open sysfs file.
+"""
+
+import asyncio
+import errno
+from pathlib import Path
+
+import pytest
+
+from penguin_metrics.collectors import ac_power
+from penguin_metrics.collectors.ac_power import ACPowerCollector
+from penguin_metrics.config.schema import (
+    ACPowerConfig,
+    ACPowerMatchConfig,
+    ACPowerMatchType,
+    DefaultsConfig,
+)
+
+
+def make_collector(path: Path) -> ACPowerCollector:
+    config = ACPowerConfig(
+        name="ac", match=ACPowerMatchConfig(type=ACPowerMatchType.PATH, value=str(path))
+    )
+    return ACPowerCollector(config=config, defaults=DefaultsConfig())
+
+
+def test_online_file_is_reopened_after_it_disappears(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed read closes the kept-open file; the next cycle opens it again."""
+    online = tmp_path / "online"
+    online.write_text("1\n")
+    collector = make_collector(tmp_path)
+
+    result = asyncio.run(collector.collect())
+    assert result.data["online"] is True
+    fd = collector._online_fd
+    assert fd is not None
+
+    # Unplugged: sysfs reads through the old descriptor fail with ENODEV
+    def gone(fd: int, n: int, offset: int) -> bytes:
+        raise OSError(errno.ENODEV, "No such device")
+
+    with monkeypatch.context() as m:
+        m.setattr(ac_power.os, "pread", gone)
+        result = asyncio.run(collector.collect())
+    assert not result.available
+    assert collector._online_fd is None
+
+    # Plugged back in as a new file: the next read opens it again
+    online.unlink()
+    online.write_text("0\n")
+    result = asyncio.run(collector.collect())
+    assert result.available
+    assert result.data["online"] is False
+
+    collector.close()
+    assert collector._online_fd is None
+
+
+def test_missing_online_file_is_unavailable(tmp_path: Path) -> None:
+    """A supply without an online file reports unavailable and keeps no descriptor."""
+    collector = make_collector(tmp_path / "missing")
+
+    result = asyncio.run(collector.collect())
+
+    assert not result.available
+    assert collector._online_fd is None
@@ -0,0 +1,217 @@
+"""
+Tests for application auto-refresh of discovered sources.
+"""
+
+import asyncio
+from pathlib import Path
+
+from penguin_metrics.app import Application, _next_slot
+from penguin_metrics.collectors.base import Collector, CollectorResult
+from penguin_metrics.config.loader import ConfigLoader
+from penguin_metrics.models.device import Device
+from penguin_metrics.models.sensor import Sensor
+
+
+class FakeFan(Collector):
+    """Fan collector stand-in; initialize() raises while `broken` is set."""
+
+    SOURCE_TYPE = "fan"
+
+    def __init__(self, name: str, broken: bool = False):
+        super().__init__(name=name, collector_id=name)
+        self.broken = broken
+        self.closed = False
+        self.runs: list[float] = []
+
+    async def initialize(self) -> None:
+        if self.broken:
+            raise OSError("attributes not readable yet")
+        await super().initialize()
+
+    def create_device(self) -> Device | None:
+        return None
+
+    def create_sensors(self) -> list[Sensor]:
+        return []
+
+    async def collect(self) -> CollectorResult:
+        self.runs.append(asyncio.get_running_loop().time())
+        return CollectorResult()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FanApp(Application):
+    """Application whose fan discovery and hwmon listing are scripted by the test."""
+
+    def __init__(self, tmp_path: Path):
+        config = ConfigLoader().load_string(
+            f'homeassistant {{ state_file "{tmp_path / "sensors.json"}"; }}'
+        )
+        config.auto_fans.enabled = True
+        super().__init__(config)
+        self.listing: tuple[str, ...] = ("hwmon0",)
+        self.found: list[Collector] = []
+        self.scans = 0
+
+    def _listing_fingerprint(self, path: str) -> object:
+        return self.listing
+
+    def _auto_discover_fans(
+        self, exclude: frozenset[str], topic_prefix: str, parent_device: Device | None = None
+    ) -> list[Collector]:
+        self.scans += 1
+        return [self._auto_collector("fan", c.collector_id) or c for c in self.found]
+
+
+def test_listing_is_trusted_only_after_a_stable_complete_scan(tmp_path: Path) -> None:
+    """A changed listing is rescanned until stable, so a late hot-plugged entry is added."""
+
+    async def run() -> tuple[list[int], bool]:
+        app = FanApp(tmp_path)
+        scans = []
+        for step in range(6):
+            if step == 3:
+                # Hot-plug: the entry is listed before its attributes can be read
+                app.listing = ("hwmon0", "hwmon1")
+            if step == 4:
+                app.found = [FakeFan("fan1")]
+            await app._refresh_auto_discovered()
+            scans.append(app.scans)
+        return scans, "fan:fan1" in app.collectors
+
+    scans, added = asyncio.run(run())
+    # New listing is rescanned twice before it is trusted, then skipped
+    assert scans == [1, 2, 2, 3, 4, 4]
+    assert added
+
+
+def test_failed_add_keeps_rescanning(tmp_path: Path) -> None:
+    """A collector that fails to initialize keeps its source rescanned until it is added."""
+
+    async def run() -> tuple[int, bool]:
+        app = FanApp(tmp_path)
+        fan = FakeFan("fan1", broken=True)
+        app.found = [fan]
+        for _ in range(3):
+            await app._refresh_auto_discovered()
+        fan.broken = False
+        await app._refresh_auto_discovered()
+        return app.scans, "fan:fan1" in app.collectors
+
+    assert asyncio.run(run()) == (4, True)
+
+
+def test_next_slot_is_on_the_grid_and_at_least_half_an_interval_away() -> None:
+    """Deadlines land on interval multiples, skipping slots less than half an interval away."""
+    assert _next_slot(100.0, 10.0) == 110.0
+    assert _next_slot(103.0, 10.0) == 110.0
+    assert _next_slot(105.0, 10.0) == 110.0
+    # Less than half an interval to the next slot: take the one after
+    assert _next_slot(106.0, 10.0) == 120.0
+    assert _next_slot(109.999, 10.0) == 120.0
+    assert _next_slot(5.0, 0.0) == 5.0
+
+
+def test_scheduler_runs_collectors_sharing_an_interval_together(tmp_path: Path) -> None:
+    """After a first immediate cycle, collectors come due together on the interval grid."""
+    interval = 10.0
+
+    async def run() -> list[list[float]]:
+        app = FanApp(tmp_path)
+        fans = [FakeFan("fan1"), FakeFan("fan2")]
+        # Drive the loop clock by hand: timers fire only when the test advances it
+        clock = 97.5  # A quarter interval before the 100.0 grid slot
+        loop = asyncio.get_running_loop()
+        loop.time = lambda: clock  # type: ignore[method-assign]
+
+        async def advance(to: float) -> None:
+            nonlocal clock
+            clock = to
+            for _ in range(50):
+                await asyncio.sleep(0)
+
+        for fan in fans:
+            fan.update_interval = interval
+            assert await app._add_collector(fan)
+        app._running = True
+        scheduler = asyncio.create_task(app._scheduler_loop())
+        for to in (97.5, 100.0, 109.9, 110.0, 120.0):
+            await advance(to)
+        app._running = False
+        scheduler.cancel()
+        await asyncio.gather(scheduler, return_exceptions=True)
+        return [fan.runs for fan in fans]
+
+    # The 100.0 slot is a quarter interval after the first cycle, so it is skipped
+    assert asyncio.run(run()) == [[97.5, 110.0, 120.0], [97.5, 110.0, 120.0]]
+
+
+def test_unchanged_data_is_skipped_only_after_a_queued_publish(tmp_path: Path) -> None:
+    """republish_unchanged skips data only once it was queued, and not after a reconnect."""
+
+    async def run() -> list[bool]:
+        app = FanApp(tmp_path)
+        app.config.defaults.republish_unchanged = 60.0
+        fan = FakeFan("fan1")
+        sent: list[bool] = []
+        queued = iter([False, True, True])
+
+        async def publish_json(topic: str, data: dict) -> bool:
+            sent.append(ok := next(queued))
+            return ok
+
+        app.mqtt.publish_json = publish_json  # type: ignore[method-assign]
+        await app._run_collector(fan, "topic")  # Dropped by the queue
+        await app._run_collector(fan, "topic")  # Retried, queued
+        await app._run_collector(fan, "topic")  # Unchanged: skipped
+        app.mqtt._connection_count += 1
+        await app._run_collector(fan, "topic")  # Reconnected: published again
+        return sent
+
+    assert asyncio.run(run()) == [False, True, True]
+
+
+def test_refresh_adds_keeps_and_removes_auto_discovered_collectors(tmp_path: Path) -> None:
+    """Refresh adds new sources, leaves unchanged ones alone, and tears down removed ones."""
+
+    async def run() -> None:
+        app = FanApp(tmp_path)
+        fan = FakeFan("fan1")
+        app.found = [fan]
+
+        # Added: initialized, registered as auto-discovered and scheduled
+        await app._refresh_auto_discovered()
+        key = fan.collector_key
+        assert app.collectors[key] is fan
+        assert app._auto_keys["fan"] == {key}
+        seq = app._scheduled[key]
+        topic = app._source_topics[key]
+
+        # Unchanged: the same collector stays, its schedule is untouched
+        await app._refresh_auto_discovered()
+        assert app.collectors[key] is fan
+        assert app._scheduled[key] == seq
+        assert not fan.closed
+
+        # Removed: in-flight cycle cancelled, source topic cleared, collector closed
+        cycle = asyncio.create_task(asyncio.sleep(60))
+        app._collector_tasks[key] = cycle
+        while not app.mqtt._message_queue.empty():
+            app.mqtt._message_queue.get_nowait()
+        app.found = []
+        app.listing = ()
+        await app._refresh_auto_discovered()
+
+        assert key not in app.collectors
+        assert app._auto_keys["fan"] == set()
+        assert key not in app._scheduled and key not in app._collector_tasks
+        assert cycle.cancelled()
+        assert fan.closed
+        queued = []
+        while not app.mqtt._message_queue.empty():
+            queued.append(app.mqtt._message_queue.get_nowait())
+        assert (topic, "") in [(t, p) for t, p, _, _ in queued]
+
+    asyncio.run(run())
@@ -5,7 +5,7 @@ Tests for configuration loading and validation.
 from pathlib import Path
 
 from penguin_metrics.config.loader import ConfigLoader
-from penguin_metrics.config.schema import Config
+from penguin_metrics.config.schema import AutoDiscoveryConfig, BatteryConfig, Config
 
 
 def test_load_example_config() -> None:
@@ -43,3 +43,58 @@ def test_load_alias_matches_load_file() -> None:
 
     assert isinstance(via_alias, Config)
     assert via_alias.mqtt.host == via_direct.mqtt.host
+
+
+def test_load_file_sees_included_file_changes(tmp_path: Path) -> None:
+    """Every load parses again, including edits to included files only."""
+    config_path = tmp_path / "config.conf"
+    included = tmp_path / "mqtt.conf"
+    config_path.write_text('include "mqtt.conf";\n')
+    included.write_text('mqtt { host "broker-a"; }\n')
+
+    first = ConfigLoader().load_file(config_path)
+    included.write_text('mqtt { host "broker-b"; }\n')
+    second = ConfigLoader().load_file(config_path)
+
+    assert second is not first
+    assert first.mqtt.host == "broker-a"
+    assert second.mqtt.host == "broker-b"
+
+
+def test_auto_discovery_matches_globs() -> None:
+    """Filters include by glob, excludes take precedence, no filters includes all."""
+    cfg = AutoDiscoveryConfig(filters=["docker*", "nginx"], excludes=["*-test"])
+    assert cfg.matches("docker.service")
+    assert cfg.matches("nginx")
+    assert not cfg.matches("nginx2")
+    assert not cfg.matches("docker-test")
+
+    assert AutoDiscoveryConfig().matches("anything")
+    assert not AutoDiscoveryConfig(excludes=["a?c"]).matches("abc")
+
+
+def test_auto_discovery_apply_overrides() -> None:
+    """Test that only fields of the target config class are overridden."""
+    cfg = AutoDiscoveryConfig(options={"voltage": False, "label": True}, update_interval=5.0)
+    battery = BatteryConfig(name="BAT0")
+    cfg.apply_overrides(battery)
+
+    assert battery.voltage is False
+    assert battery.update_interval == 5.0
+    assert cfg.options_for(BatteryConfig) == {"voltage": False}
+
+
+def test_event_loop_setting() -> None:
+    """Test top-level event_loop parsing and fallback for unknown values."""
+    loader = ConfigLoader()
+    assert loader.load_string("event_loop asyncio;").event_loop == "asyncio"
+    assert loader.load_string("event_loop tokio;").event_loop == "auto"
+    assert loader.load_string("").event_loop == "auto"
+
+
+def test_republish_unchanged_setting() -> None:
+    """Test defaults republish_unchanged duration parsing (0 = publish every cycle)."""
+    loader = ConfigLoader()
+    config = loader.load_string("defaults { republish_unchanged 5m; }")
+    assert config.defaults.republish_unchanged == 300.0
+    assert loader.load_string("").defaults.republish_unchanged == 0.0
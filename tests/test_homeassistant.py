@@ -0,0 +1,75 @@
+"""
+Tests for Home Assistant discovery registration.
+"""
+
+import asyncio
+import json
+
+from penguin_metrics.config.schema import HomeAssistantConfig, MQTTConfig
+from penguin_metrics.models.device import Device
+from penguin_metrics.models.sensor import create_sensor
+from penguin_metrics.mqtt.client import MQTTClient
+from penguin_metrics.mqtt.homeassistant import HomeAssistantDiscovery
+
+
+def test_flush_sensors_dedupes_by_unique_id() -> None:
+    """Queued sensors are registered once per unique_id."""
+
+    async def run() -> tuple[int, list[str]]:
+        ha = HomeAssistantDiscovery(MQTTClient(MQTTConfig()), HomeAssistantConfig())
+        cpu, mem = Device(name="cpu"), Device(name="mem")
+        ha.queue_sensors(
+            [
+                create_sensor("system", "cpu", "load", "Load", device=cpu),
+                create_sensor("system", "mem", "used", "Used", device=mem),
+            ]
+        )
+        ha.queue_sensors([create_sensor("system", "cpu", "load", "Load", device=cpu)])
+        registered = await ha.flush_sensors()
+        return registered, sorted(ha._registered_sensors)
+
+    registered, sensor_ids = asyncio.run(run())
+    assert registered == 2
+    assert len(sensor_ids) == 2
+
+
+def test_unregister_sensors_clears_discovery_topics() -> None:
+    """Unregistering publishes empty retained discovery configs and forgets the sensors."""
+
+    async def run() -> tuple[list[tuple[str, str | bytes, int, bool]], dict[str, str]]:
+        mqtt = MQTTClient(MQTTConfig())
+        ha = HomeAssistantDiscovery(mqtt, HomeAssistantConfig())
+        sensor = create_sensor("system", "cpu", "load", "Load", device=Device(name="cpu"))
+        ha._registered_sensors[sensor.unique_id] = sensor.entity_type
+        await ha.unregister_sensors([sensor])
+        return [mqtt._message_queue.get_nowait()], ha._registered_sensors
+
+    messages, registered = asyncio.run(run())
+    assert len(messages) == 1
+    topic, payload, qos, retain = messages[0]
+    assert topic.startswith("homeassistant/sensor/") and topic.endswith("/config")
+    assert (payload, qos, retain) == ("", 1, True)
+    assert registered == {}
+
+
+def test_register_skips_clear_for_known_entity_type(tmp_path) -> None:
+    """The cross-type clear is skipped for unique_ids known with the same entity type."""
+    sensor = create_sensor("system", "cpu", "load", "Load", device=Device(name="cpu"))
+    new = create_sensor("system", "cpu", "temp", "Temp", device=Device(name="cpu"))
+    state_file = tmp_path / "sensors.json"
+    state_file.write_text(json.dumps({"sensors": {sensor.unique_id: "sensor"}}))
+
+    async def run() -> list[str]:
+        mqtt = MQTTClient(MQTTConfig())
+        ha = HomeAssistantDiscovery(mqtt, HomeAssistantConfig(), state_file=str(state_file))
+        await ha.register_sensors([sensor, new])
+        queue = mqtt._message_queue
+        return [queue.get_nowait()[0] for _ in range(queue.qsize())]
+
+    topics = asyncio.run(run())
+    # Known sensor: config only; new sensor: clear binary_sensor + config
+    assert topics == [
+        f"homeassistant/sensor/{sensor.unique_id}/config",
+        f"homeassistant/binary_sensor/{new.unique_id}/config",
+        f"homeassistant/sensor/{new.unique_id}/config",
+    ]
@@ -0,0 +1,62 @@
+"""
+Tests for logging setup.
+"""
+
+import logging
+from pathlib import Path
+
+from penguin_metrics.logging import LogConfig, setup_logging
+
+
+def test_setup_logging_reuses_handlers(tmp_path: Path) -> None:
+    """Reconfiguring keeps existing handlers and only updates their settings."""
+    root = logging.getLogger("penguin_metrics")
+    log_file = str(tmp_path / "app.log")
+
+    setup_logging(LogConfig(console_level="warning"))
+    console = root.handlers[0]
+
+    setup_logging(LogConfig(console_level="debug", file_enabled=True, file_path=log_file))
+    assert root.handlers[0] is console
+    assert console.level == logging.DEBUG
+    file_handler = root.handlers[1]
+
+    setup_logging(LogConfig(console_level="info", file_enabled=True, file_path=log_file))
+    assert root.handlers == [console, file_handler]
+
+    setup_logging(LogConfig())
+    assert root.handlers == [console]
+
+
+def test_setup_logging_skips_identical_config() -> None:
+    """Applying an equal LogConfig twice leaves the installed handlers untouched."""
+    root = logging.getLogger("penguin_metrics")
+
+    setup_logging(LogConfig(console_level="error"))
+    console = root.handlers[0]
+    formatter = console.formatter
+
+    setup_logging(LogConfig(console_level="error"))
+    assert root.handlers == [console]
+    assert console.formatter is formatter
+
+    setup_logging(LogConfig(console_level="debug"))
+    assert console.formatter is not formatter
+
+
+def test_logger_level_follows_most_verbose_handler(tmp_path: Path) -> None:
+    """Disabled levels are rejected by the logger itself, not only by handlers."""
+    root = logging.getLogger("penguin_metrics")
+
+    setup_logging(LogConfig(console_level="warning"))
+    assert not root.isEnabledFor(logging.INFO)
+
+    setup_logging(
+        LogConfig(
+            console_level="warning",
+            file_enabled=True,
+            file_path=str(tmp_path / "app.log"),
+            file_level="debug",
+        )
+    )
+    assert root.isEnabledFor(logging.DEBUG)
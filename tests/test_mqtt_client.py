@@ -0,0 +1,130 @@
+"""
+Tests for MQTT client publish batching.
+"""
+
+import asyncio
+
+import aiomqtt
+
+from penguin_metrics.config.schema import MQTTConfig
+from penguin_metrics.mqtt.client import MQTTClient
+
+
+def test_collect_batch_keeps_newest_payload_per_topic() -> None:
+    """Only the newest payload per topic is kept, in queue order."""
+
+    async def run() -> list[tuple[str, str, int, bool]]:
+        client = MQTTClient(MQTTConfig())
+        for message in (("a", "2", 1, True), ("b", "1", 1, True), ("a", "3", 1, True)):
+            client._message_queue.put_nowait(message)
+        return await client._collect_batch(("a", "1", 1, True))
+
+    assert asyncio.run(run()) == [("b", "1", 1, True), ("a", "3", 1, True)]
+
+
+def test_collect_batch_respects_byte_budget() -> None:
+    """A batch stops taking queued messages once the byte budget is reached."""
+
+    async def run() -> tuple[int, int]:
+        client = MQTTClient(MQTTConfig(max_batch_bytes=10))
+        for i in range(5):
+            client._message_queue.put_nowait((f"t{i}", "x" * 5, 1, True))
+        batch = await client._collect_batch(("first", "x" * 5, 1, True))
+        return len(batch), client._message_queue.qsize()
+
+    assert asyncio.run(run()) == (2, 4)
+
+
+def test_publish_many_queues_in_order() -> None:
+    """publish_many() encodes payloads and queues them back to back."""
+
+    async def run() -> list[tuple[str, str | bytes, int, bool]]:
+        client = MQTTClient(MQTTConfig())
+        await client.publish_many([("a", ""), ("b", 5)], qos=1, retain=True)
+        return [client._message_queue.get_nowait() for _ in range(2)]
+
+    assert asyncio.run(run()) == [("a", "", 1, True), ("b", "5", 1, True)]
+
+
+def test_slow_ack_does_not_block_next_batch() -> None:
+    """A batch waiting for acks does not hold back the next one."""
+
+    async def run() -> list[str]:
+        client = MQTTClient(MQTTConfig())
+        sent: list[str] = []
+        stalled = asyncio.Event()
+
+        async def publish_raw(topic: str, *args: object) -> None:
+            if topic == "slow":
+                await stalled.wait()
+            sent.append(topic)
+
+        client._publish_raw = publish_raw  # type: ignore[method-assign]
+        client._connected = True
+        client._running = True
+        publisher = asyncio.create_task(client._publisher_loop())
+
+        await client.publish("slow", "1")
+        await asyncio.sleep(0.01)
+        await client.publish("fast", "2")
+        await asyncio.sleep(0.01)
+        done = list(sent)
+
+        stalled.set()
+        client._running = False
+        publisher.cancel()
+        await asyncio.gather(publisher, *client._inflight_batches, return_exceptions=True)
+        return done
+
+    assert asyncio.run(run()) == ["fast"]
+
+
+def test_batch_is_requeued_when_disconnected() -> None:
+    """A batch sent while disconnected is held for resending."""
+
+    async def run() -> list[tuple[str, str | bytes, int, bool]]:
+        client = MQTTClient(MQTTConfig())
+        await client._send_batch([("t/a", b"1", 1, True)])
+        return list(client._pending.values())
+
+    assert asyncio.run(run()) == [("t/a", b"1", 1, True)]
+
+
+def test_batches_after_a_failure_are_requeued() -> None:
+    """Batches dispatched after a connection loss are held, not dropped."""
+
+    async def run() -> tuple[bool, list[str]]:
+        client = MQTTClient(MQTTConfig())
+
+        class LostConnection:
+            async def publish(self, topic: str, *args: object, **kwargs: object) -> None:
+                raise aiomqtt.MqttError("connection lost")
+
+        client._client = LostConnection()  # type: ignore[assignment]
+        client._connected = True
+        await client._send_batch([("fail", "1", 1, True)])
+        # Collected before the failure was noticed, dispatched after it
+        await client._send_batch([("late", "2", 1, True)])
+        return client._connected, list(client._pending)
+
+    assert asyncio.run(run()) == (False, ["fail", "late"])
+
+
+def test_requeued_message_does_not_supersede_a_newer_one() -> None:
+    """A newer queued payload wins over a re-queued older one for the same topic."""
+
+    async def run() -> list[list[tuple[str, str | bytes, int, bool]]]:
+        client = MQTTClient(MQTTConfig())
+
+        class LostConnection:
+            async def publish(self, topic: str, *args: object, **kwargs: object) -> None:
+                raise aiomqtt.MqttError("connection lost")
+
+        client._client = LostConnection()  # type: ignore[assignment]
+        client._connected = True
+        # A newer state for the topic is queued while the older one is in flight
+        client._message_queue.put_nowait(("state", "new", 1, True))
+        await client._send_batch([("state", "old", 1, True), ("other", "1", 1, True)])
+        return [await client._collect_batch(None), await client._collect_batch(None)]
+
+    assert asyncio.run(run()) == [[("other", "1", 1, True), ("state", "new", 1, True)], []]
@@ -0,0 +1,65 @@
+"""
+Tests for systemd unit listing fallback.
+"""
+
+import asyncio
+
+import pytest
+
+from penguin_metrics.utils import systemd
+from penguin_metrics.utils.systemd import DBUS_RETRY_MIN, SystemdUnits
+
+
+class ScriptedUnits(SystemdUnits):
+    """SystemdUnits whose D-Bus calls raise the scripted errors, then succeed."""
+
+    def __init__(self, errors: list[Exception]):
+        super().__init__()
+        self._dbus_retry_at = 0.0  # As if dbus-fast were installed
+        self.errors = errors
+        self.dbus_calls = 0
+
+    async def _list_dbus(self, patterns: tuple[str, ...]) -> list[str]:
+        self.dbus_calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return ["dbus.service"]
+
+    @staticmethod
+    async def _list_systemctl(patterns: tuple[str, ...]) -> list[str]:
+        return ["systemctl.service"]
+
+
+def test_dbus_is_retried_after_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """After a D-Bus error, systemctl is used until a doubling backoff expires."""
+    now = 1000.0
+    monkeypatch.setattr(systemd.time, "monotonic", lambda: now)
+    units = ScriptedUnits([RuntimeError("timeout"), RuntimeError("timeout")])
+
+    assert asyncio.run(units.list_services()) == ["systemctl.service"]
+    # Within the backoff: systemctl only
+    now += DBUS_RETRY_MIN - 1
+    assert asyncio.run(units.list_services()) == ["systemctl.service"]
+    assert units.dbus_calls == 1
+
+    # Retried after the backoff; fails again, so the next backoff is doubled
+    now += 1
+    assert asyncio.run(units.list_services()) == ["systemctl.service"]
+    now += DBUS_RETRY_MIN * 2 - 1
+    assert asyncio.run(units.list_services()) == ["systemctl.service"]
+    assert units.dbus_calls == 2
+
+    now += 1
+    assert asyncio.run(units.list_services()) == ["dbus.service"]
+
+
+def test_missing_bus_is_permanent(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A missing system bus socket disables D-Bus for good."""
+    now = 1000.0
+    monkeypatch.setattr(systemd.time, "monotonic", lambda: now)
+    units = ScriptedUnits([FileNotFoundError("/run/dbus/system_bus_socket")])
+
+    assert asyncio.run(units.list_services()) == ["systemctl.service"]
+    now += 1e6
+    assert asyncio.run(units.list_services()) == ["systemctl.service"]
+    assert units.dbus_calls == 1